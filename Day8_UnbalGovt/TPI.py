@@ -39,6 +39,13 @@ import os
 ------------------------------------------------------------------------
 '''
 
+# Warm-start cache for the batched c1 solves in get_cnbpath(), keyed on
+# the cohort block and batch size. Successive TPI outer iterations have
+# nearly identical price paths, so the previous iteration's c1 solution
+# converges in a handful of quasi-Newton steps instead of starting from
+# the static initial guess every time
+_c1_warm_starts = {}
+
 
 def get_path(x1, xT, T, spec):
     '''
@@ -106,7 +113,8 @@ def get_cnbpath(params, rpath, wpath, xpath):
                 per household
 
     OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
-        hh.c1_bSp1err()
+        hh.solve_c1_batch()
+        hh.make_c1_bSp1err()
         hh.get_cnb_vecs()
         hh.get_n_errors()
         hh.get_b_errors()
@@ -148,7 +156,7 @@ def get_cnbpath(params, rpath, wpath, xpath):
                     elements of matrix should only be in first column
                     and first row
     c1_options    = length 1 dict, options for
-                    opt.root(hh.c1_bSp1err,...)
+                    opt.root(hh.make_c1_bSp1err(c1_args),...)
     b_err_params  = length 2 tuple, args to pass into
                     hh.get_b_errors()
     p             = integer in [1, S-1], index representing number of
@@ -156,9 +164,9 @@ def get_cnbpath(params, rpath, wpath, xpath):
                     incomplete lifetimes
     c1_init       = scalar > 0, guess for initial period consumption
     c1_args       = length 10 tuple, args to pass into
-                    opt.root(hh.c1_bSp1err,...)
+                    opt.root(hh.make_c1_bSp1err(c1_args),...)
     results_c1    = results object, solution from
-                    opt.root(hh.c1_bSp1err,...)
+                    opt.root(hh.make_c1_bSp1err(c1_args),...)
     c1            = scalar > 0, optimal initial consumption
     cnb_args      = length 8 tuple, args to pass into
                     hh.get_cnb_vecs()
@@ -194,22 +202,54 @@ def get_cnbpath(params, rpath, wpath, xpath):
     b_err_path = np.zeros((S, T2 + S - 1))
     bSp1_err_path = np.zeros((S, T2))
     # Solve the incomplete remaining lifetime decisions of agents alive
-    # in period t=1 but not born in period t=1
+    # in period t=1 but not born in period t=1. All S-1 cohorts are
+    # independent scalar problems in c1, so they are solved in one
+    # batched quasi-Newton with each cohort's remaining lifetime padded
+    # into a row of (S-1, S) matrices; cohorts the batched solver does
+    # not converge fall back on the original scalar root finder
     c1_options = {'maxiter': 500}
     b_err_params = (beta, sigma, tau_k)
+    batch_params = (beta, sigma, l_tilde, b_ellip, upsilon, tax_params,
+                    diff)
+    rmat = np.zeros((S - 1, S))
+    wmat = np.zeros((S - 1, S))
+    xmat = np.zeros((S - 1, S))
+    chi_mat = np.zeros((S - 1, S))
+    b_init_vec = np.zeros(S - 1)
+    p_vec = np.arange(1, S)
+    for p in range(1, S):
+        rmat[p - 1, :p] = rpath[:p]
+        wmat[p - 1, :p] = wpath[:p]
+        xmat[p - 1, :p] = xpath[:p]
+        chi_mat[p - 1, :p] = chi_n_vec[-p:]
+        b_init_vec[p - 1] = bvec1[-p]
+    c1_guess = _c1_warm_starts.get(('incomplete', S - 1),
+                                   np.full(S - 1, 0.1))
+    c1_vec, cmat, nmat, bmat, bSp1_vec, c1_conv = \
+        hh.solve_c1_batch(c1_guess, rmat, wmat, xmat,
+                          chi_mat, b_init_vec, p_vec, batch_params,
+                          TPI_tol)
+    if c1_conv.all():
+        _c1_warm_starts[('incomplete', S - 1)] = c1_vec.copy()
     for p in range(1, S):
-        c1_init = 0.1
-        c1_args = (bvec1[-p], beta, sigma, l_tilde, b_ellip, upsilon,
-                   chi_n_vec[-p:], tax_params, xpath[:p],
-                   rpath[:p], wpath[:p], diff)
-        results_c1 = \
-            opt.root(hh.c1_bSp1err, c1_init, args=(c1_args),
-                     method='lm', tol=TPI_tol, options=(c1_options))
-        c_1 = results_c1.x
-        cnb_args = (bvec1[-p], beta, sigma, l_tilde, b_ellip, upsilon,
-                    chi_n_vec[-p:], tax_params, diff)
-        cvec, nvec, bvec, b_Sp1 = \
-            hh.get_cnb_vecs(c_1, rpath[:p], wpath[:p], xpath[:p], cnb_args)
+        if c1_conv[p - 1]:
+            cvec = cmat[p - 1, :p]
+            nvec = nmat[p - 1, :p]
+            bvec = bmat[p - 1, :p]
+            b_Sp1 = bSp1_vec[p - 1]
+        else:
+            c1_args = (bvec1[-p], beta, sigma, l_tilde, b_ellip, upsilon,
+                       chi_n_vec[-p:], tax_params, xpath[:p],
+                       rpath[:p], wpath[:p], diff)
+            results_c1 = \
+                opt.root(hh.make_c1_bSp1err(c1_args), c1_vec[p - 1],
+                         method='lm', tol=TPI_tol, options=(c1_options))
+            c_1 = results_c1.x
+            cnb_args = (bvec1[-p], beta, sigma, l_tilde, b_ellip, upsilon,
+                        chi_n_vec[-p:], tax_params, diff)
+            cvec, nvec, bvec, b_Sp1 = \
+                hh.get_cnb_vecs(c_1, rpath[:p], wpath[:p], xpath[:p],
+                                cnb_args)
         DiagMaskc = np.eye(p, dtype=bool)
         DiagMaskb = np.eye(p - 1, dtype=bool)
         cpath[-p:, :p] = DiagMaskc * cvec + cpath[-p:, :p]
@@ -231,26 +271,45 @@ def get_cnbpath(params, rpath, wpath, xpath):
             #       np.hstack((n_err_vec, b_err_vec, b_Sp1)).max())
 
     # Solve the remaining lifetime decisions of agents born between
-    # period t=1 and t=T (complete lifetimes)
+    # period t=1 and t=T (complete lifetimes), batching all T2 birth
+    # cohorts into one quasi-Newton solve over sliding windows of the
+    # price and transfer paths
+    rmat = np.zeros((T2, S))
+    wmat = np.zeros((T2, S))
+    xmat = np.zeros((T2, S))
+    for t in range(T2):
+        rmat[t, :] = rpath[t:t + S]
+        wmat[t, :] = wpath[t:t + S]
+        xmat[t, :] = xpath[t:t + S]
+    chi_mat = np.tile(chi_n_vec, (T2, 1))
+    c1_guess = _c1_warm_starts.get(('complete', T2), np.full(T2, 0.1))
+    c1_vec, cmat, nmat, bmat, bSp1_vec, c1_conv = \
+        hh.solve_c1_batch(c1_guess, rmat, wmat, xmat, chi_mat,
+                          np.zeros(T2), np.full(T2, S), batch_params,
+                          TPI_tol)
+    if c1_conv.all():
+        _c1_warm_starts[('complete', T2)] = c1_vec.copy()
     DiagMaskc = np.eye(S, dtype=bool)
     DiagMaskb = np.eye(S - 1, dtype=bool)
     for t in range(T2):  # Go from periods 1 to T (columns 0 to T-1)
-        if t == 0:
-            c1_init = 0.1
+        if c1_conv[t]:
+            cvec = cmat[t, :]
+            nvec = nmat[t, :]
+            bvec = bmat[t, :]
+            b_Sp1 = bSp1_vec[t]
         else:
-            c1_init = cpath[0, t - 1]
-        c1_args = (0.0, beta, sigma, l_tilde, b_ellip, upsilon,
-                   chi_n_vec, tax_params, xpath[t:t+S],
-                   rpath[t:t + S], wpath[t:t + S], diff)
-        results_c1 = \
-            opt.root(hh.c1_bSp1err, c1_init, args=(c1_args),
-                     method='lm', tol=TPI_tol, options=(c1_options))
-        c_1 = results_c1.x
-        cnb_args = (0.0, beta, sigma, l_tilde, b_ellip, upsilon,
-                    chi_n_vec, tax_params, diff)
-        cvec, nvec, bvec, b_Sp1 = \
-            hh.get_cnb_vecs(c_1, rpath[t:t + S], wpath[t:t + S],
-                            xpath[t:t + S], cnb_args)
+            c1_args = (0.0, beta, sigma, l_tilde, b_ellip, upsilon,
+                       chi_n_vec, tax_params, xpath[t:t+S],
+                       rpath[t:t + S], wpath[t:t + S], diff)
+            results_c1 = \
+                opt.root(hh.make_c1_bSp1err(c1_args), c1_vec[t],
+                         method='lm', tol=TPI_tol, options=(c1_options))
+            c_1 = results_c1.x
+            cnb_args = (0.0, beta, sigma, l_tilde, b_ellip, upsilon,
+                        chi_n_vec, tax_params, diff)
+            cvec, nvec, bvec, b_Sp1 = \
+                hh.get_cnb_vecs(c_1, rpath[t:t + S], wpath[t:t + S],
+                                xpath[t:t + S], cnb_args)
         cpath[:, t:t + S] = DiagMaskc * cvec + cpath[:, t:t + S]
         npath[:, t:t + S] = DiagMaskc * nvec + npath[:, t:t + S]
         n_args = (wpath[t:t + S], cvec, sigma, l_tilde, chi_n_vec, b_ellip,
@@ -983,8 +1042,7 @@ def get_TPI(params, bvec1, graphs):
         cur_path = os.path.split(os.path.abspath(__file__))[0]
         output_fldr = "images"
         output_dir = os.path.join(cur_path, output_fldr)
-        if not os.access(output_dir, os.F_OK):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
         # Plot time path of aggregate capital stock
         tvec = np.linspace(1, T2 + S - 1, T2 + S - 1)
@@ -993,7 +1051,7 @@ def get_TPI(params, bvec1, graphs):
         plt.plot(tvec, Kpath, marker='D')
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for aggregate capital stock K')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Aggregate capital $K_{t}$')
@@ -1007,7 +1065,7 @@ def get_TPI(params, bvec1, graphs):
         plt.plot(tvec, Lpath, marker='D')
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for aggregate labor L')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Aggregate labor $L_{t}$')
@@ -1021,7 +1079,7 @@ def get_TPI(params, bvec1, graphs):
         plt.plot(tvec, Ypath, marker='D')
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for aggregate output (GDP) Y')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Aggregate output $Y_{t}$')
@@ -1035,7 +1093,7 @@ def get_TPI(params, bvec1, graphs):
         plt.plot(tvec, Cpath, marker='D')
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for aggregate consumption C')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Aggregate consumption $C_{t}$')
@@ -1049,7 +1107,7 @@ def get_TPI(params, bvec1, graphs):
         plt.plot(tvec, wpath, marker='D')
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for real wage w')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Real wage $w_{t}$')
@@ -1063,7 +1121,7 @@ def get_TPI(params, bvec1, graphs):
         plt.plot(tvec, rpath, marker='D')
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for real interest rate r')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Real interest rate $r_{t}$')
@@ -1133,7 +1191,7 @@ def get_TPI(params, bvec1, graphs):
         plt.legend(handles=[R, G, T, D])
         # for the minor ticks, use no labels; default NullFormatter
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.title('Time path for fiscal variables')
         plt.xlabel(r'Period $t$')
         plt.ylabel(r'Ratios of fiscal variables to GDP')
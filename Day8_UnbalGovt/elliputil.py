@@ -71,7 +71,7 @@ def gen_ellip(h, k, a, b, mu, graph=True):
         # for the minor ticks, use no labels; default NullFormatter
         minorLocator = MultipleLocator(1)
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.xlabel(r'$x$')
         plt.ylabel(r'$y$')
         plt.xlim((h - 1.6 * a, h + 1.6 * a))
@@ -141,7 +141,7 @@ def gen_uprightquad(hvec, kvec, avec, bvec, muvec, graph=True):
         # for the minor ticks, use no labels; default NullFormatter
         minorLocator = MultipleLocator(1)
         ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
+        plt.grid(visible=True, which='major', color='0.65', linestyle='-')
         plt.xlabel(r'$x$')
         plt.ylabel(r'$y$')
         # plt.xlim((hvec - 1.6 * avec, hvec + 1.6 * avec))
@@ -286,8 +286,7 @@ def fit_ellip_CFE(ellip_init, cfe_params, l_tilde, graph):
             cur_path = os.path.split(os.path.abspath(__file__))[0]
             output_fldr = "images"
             output_dir = os.path.join(cur_path, output_fldr)
-            if not os.access(output_dir, os.F_OK):
-                os.makedirs(output_dir)
+            os.makedirs(output_dir, exist_ok=True)
 
             # Plot steady-state consumption and savings distributions
             MU_ellip = \
@@ -302,7 +301,7 @@ def fit_ellip_CFE(ellip_init, cfe_params, l_tilde, graph):
             # for the minor ticks, use no labels; default NullFormatter
             minorLocator = MultipleLocator(1)
             ax.xaxis.set_minor_locator(minorLocator)
-            plt.grid(b=True, which='major', color='0.65', linestyle='-')
+            plt.grid(visible=True, which='major', color='0.65', linestyle='-')
             plt.title('CFE marginal utility versus fitted elliptical',
                       fontsize=20)
             plt.xlabel(r'Labor supply $n_{s,t}$')
@@ -8,25 +8,53 @@ agents and endogenous labor supply from Chapter 7 of the OG textbook.
 This Python module imports the following module(s): None
 
 This Python module defines the following function(s):
+    _mu_c_stitch_coeffs()
+    _mdu_n_stitch_coeffs()
     get_cons()
+    _pow_neg_sigma()
+    _mu_c_stitch_vec()
+    _mdu_n_stitch_vec()
+    _bn_residual()
+    _mdu_n_and_deriv()
+    _solve_n()
+    _cnb_core()
+    _cnb_last_core()
+    _cnb_batch_core()
     MU_c_stitch()
     MDU_n_stitch()
+    _mdu_n_stitch_deriv()
+    _batched_solve_n()
     get_n_s()
     get_n_errors()
     get_b_errors()
     bn_solve()
+    bn_jac()
+    make_bn_residual()
     FOC_savings()
     FOC_labor()
     get_cnb_vecs()
     c1_bSp1err()
+    make_c1_bSp1err()
+    build_get_cnb_vecs()
+    _cnb_path_precomp()
+    get_cnb_vecs_batch()
+    solve_c1_batch()
 ------------------------------------------------------------------------
 '''
 # Import packages
+import functools
 import numpy as np
 import scipy.optimize as opt
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MultipleLocator
-import os
+
+# Numba is an optional dependency. When it is available, the stitched
+# marginal utility functions below dispatch their vector branches to
+# compiled single-pass kernels. When it is not, they fall back on the
+# original NumPy implementations
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
 '''
 ------------------------------------------------------------------------
@@ -34,6 +62,400 @@ import os
 ------------------------------------------------------------------------
 '''
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True, nogil=True, inline='always')
+    def _pow_neg_sigma(c_s, neg_sigma):
+        '''
+        ----------------------------------------------------------------
+        Compute c_s ** neg_sigma for c_s > 0 as exp(neg_sigma *
+        log(c_s)). Unlike the IEEE-strict pow, the exp/log form
+        vectorizes under fastmath, and it is only used on the
+        unconstrained lane where c_s >= epsilon > 0 guarantees the log
+        is defined
+        ----------------------------------------------------------------
+        '''
+        return np.exp(neg_sigma * np.log(c_s))
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _mu_c_stitch_vec(cvec, sigma, epsilon, b1, b2, out):
+        '''
+        ----------------------------------------------------------------
+        Compiled kernel for the vector branch of MU_c_stitch(). Fuses
+        the constraint check, the CRRA marginal utility, and the linear
+        stitch into one pass over cvec with no temporary arrays
+        ----------------------------------------------------------------
+        '''
+        for i in range(cvec.shape[0]):
+            c_s = cvec[i]
+            if c_s < epsilon:
+                out[i] = 2 * b2 * c_s + b1
+            else:
+                out[i] = _pow_neg_sigma(c_s, -sigma)
+
+        return out
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _mdu_n_stitch_vec(nvec, l_tilde, b_ellip, upsilon, eps_low,
+                          eps_high, b1, b2, d1, d2, out):
+        '''
+        ----------------------------------------------------------------
+        Compiled kernel for the vector branch of MDU_n_stitch(). Fuses
+        the three branches (low stitch, elliptical interior, high
+        stitch) into one pass over nvec with no temporary arrays
+        ----------------------------------------------------------------
+        '''
+        for i in range(nvec.shape[0]):
+            n_s = nvec[i]
+            if n_s < eps_low:
+                out[i] = 2 * b2 * n_s + b1
+            elif n_s > eps_high:
+                out[i] = 2 * d2 * n_s + d1
+            else:
+                out[i] = ((b_ellip / l_tilde) *
+                          ((n_s / l_tilde) ** (upsilon - 1)) *
+                          ((1 - ((n_s / l_tilde) ** upsilon)) **
+                           ((1 - upsilon) / upsilon)))
+
+        return out
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _bn_residual(b_guess, n_guess, r, w, x, beta, sigma, tau_l,
+                     tau_k, l_tilde, b_ellip, upsilon, chi_n_vec, diff,
+                     epsilon, mu_b1, mu_b2, eps_low, eps_high, n_b1,
+                     n_b2, n_d1, n_d2, out):
+        '''
+        ----------------------------------------------------------------
+        Compiled kernel for bn_solve(). Fuses the budget constraint,
+        the stitched marginal utilities, and both sets of Euler errors
+        into a single pass over the lifetime so that consumption and
+        the marginal utilities live in registers rather than in
+        temporary arrays. Writes the (S-1,) savings Euler errors into
+        out[:S-1] and the (S,) labor supply Euler errors into
+        out[S-1:], matching the ordering of the NumPy code path
+        ----------------------------------------------------------------
+        '''
+        S = n_guess.shape[0]
+        mu_c_prev = 0.0
+        for s in range(S):
+            if s == 0:
+                b_s = 0.0
+            else:
+                b_s = b_guess[s - 1]
+            b_sp1 = b_guess[s]
+            n_s = n_guess[s]
+            cons = ((1 + r) * b_s + w * n_s - b_sp1 + x -
+                    r * b_s * tau_k - w * n_s * tau_l)
+            if cons < epsilon:
+                mu_c = 2 * mu_b2 * cons + mu_b1
+            else:
+                mu_c = _pow_neg_sigma(cons, -sigma)
+            if n_s < eps_low:
+                mdu_n = 2 * n_b2 * n_s + n_b1
+            elif n_s > eps_high:
+                mdu_n = 2 * n_d2 * n_s + n_d1
+            else:
+                mdu_n = ((b_ellip / l_tilde) *
+                         ((n_s / l_tilde) ** (upsilon - 1)) *
+                         ((1 - ((n_s / l_tilde) ** upsilon)) **
+                          ((1 - upsilon) / upsilon)))
+            if diff:
+                out[S - 1 + s] = ((1 - tau_l) * w * mu_c -
+                                  chi_n_vec[s] * mdu_n)
+            else:
+                out[S - 1 + s] = (((1 - tau_l) * w * mu_c) /
+                                  (chi_n_vec[s] * mdu_n)) - 1
+            if s > 0:
+                if diff:
+                    out[s - 1] = (beta * (1 + (1 - tau_k) * r) * mu_c -
+                                  mu_c_prev)
+                else:
+                    out[s - 1] = ((beta * (1 + (1 - tau_k) * r) *
+                                   mu_c) / mu_c_prev) - 1
+            mu_c_prev = mu_c
+
+        return out
+
+    @njit(cache=True, fastmath=True, nogil=True, inline='always')
+    def _mdu_n_and_deriv(n_s, l_tilde, b_ellip, upsilon, eps_low,
+                         eps_high, n_b1, n_b2, n_d1, n_d2):
+        '''
+        ----------------------------------------------------------------
+        Evaluate the stitched marginal disutility of labor v'(n_s) and
+        its derivative v''(n_s) in one pass, sharing the pow
+        evaluations of the elliptical interior between the two so that
+        a Newton step costs a single lane evaluation
+        ----------------------------------------------------------------
+        '''
+        if n_s < eps_low:
+            return 2 * n_b2 * n_s + n_b1, 2 * n_b2
+        if n_s > eps_high:
+            return 2 * n_d2 * n_s + n_d1, 2 * n_d2
+        x_n = n_s / l_tilde
+        x_nu = x_n ** upsilon
+        one_m_xnu = 1 - x_nu
+        stitch_pow = one_m_xnu ** ((1 - upsilon) / upsilon)
+        mdu = ((b_ellip / l_tilde) * (x_n ** (upsilon - 1)) *
+               stitch_pow)
+        dmdu = ((b_ellip / (l_tilde ** 2)) * (upsilon - 1) *
+                (x_n ** (upsilon - 2)) * stitch_pow *
+                (1 + x_nu / one_m_xnu))
+
+        return mdu, dmdu
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _solve_n(A, chi_n, l_tilde, b_ellip, upsilon, eps_low, eps_high,
+                 n_b1, n_b2, n_d1, n_d2, n_init):
+        '''
+        ----------------------------------------------------------------
+        Solve the intratemporal labor supply FOC for a single period,
+        A = chi_n * v'(n_s), by Newton's method with the analytic
+        derivative of the stitched marginal disutility of labor, where
+        A = (1 - tau_l) * w * u'(c_s) is fixed during the solve. The
+        stitched v'(n) is monotonically increasing on the whole real
+        line and Newton converges quadratically from n_init, so the
+        loop runs a fixed trip count with no data-dependent convergence
+        branch and checks the residual once at the end. Returns the
+        solution and a convergence flag so the caller can fall back on
+        a library root finder in the rare non-converged case
+        ----------------------------------------------------------------
+        '''
+        n_s = n_init
+        for it in range(12):
+            mdu, dmdu = _mdu_n_and_deriv(n_s, l_tilde, b_ellip,
+                                         upsilon, eps_low, eps_high,
+                                         n_b1, n_b2, n_d1, n_d2)
+            n_s = n_s + (A - chi_n * mdu) / (chi_n * dmdu)
+        mdu, dmdu = _mdu_n_and_deriv(n_s, l_tilde, b_ellip, upsilon,
+                                     eps_low, eps_high, n_b1, n_b2,
+                                     n_d1, n_d2)
+
+        return n_s, abs(A - chi_n * mdu) < 1e-14 * max(1.0, abs(A))
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _cnb_core(c1, cum_growth, one_p_rnet, wnet, xpath, b_init,
+                  sigma, l_tilde, b_ellip, upsilon, chi_n_vec, epsilon,
+                  mu_b1, mu_b2, eps_low, eps_high, n_b1, n_b2, n_d1,
+                  n_d2, cvec, nvec, bvec):
+        '''
+        ----------------------------------------------------------------
+        Compiled numerical core of get_cnb_vecs(). Walks the lifetime
+        recursion in tight typed loops over plain ndarrays and scalars:
+        the consumption path from the intertemporal Euler equation, the
+        labor supply path from per-period Newton solves of the
+        intratemporal FOC, and the savings path from the budget
+        constraints. The inputs are the arrays that stay fixed while a
+        root finder varies c1: cum_growth is the cumulative product of
+        Euler growth factors (beta * (1 + (1 - tau_k) * r)) ** (1 /
+        sigma) with first element 1, one_p_rnet is 1 + (1 - tau_k) *
+        rpath, and wnet is (1 - tau_l) * wpath, all precomputed once
+        per solve by the caller. Writes the paths into the caller-
+        supplied cvec, nvec, and bvec buffers and returns the terminal
+        savings b_Sp1 along with a flag that is False if any labor
+        supply solve failed to converge, in which case the caller falls
+        back on the NumPy code path
+        ----------------------------------------------------------------
+        '''
+        p = cum_growth.shape[0]
+        ok = True
+        for s in range(p):
+            c_s = c1 * cum_growth[s]
+            cvec[s] = c_s
+            if c_s < epsilon:
+                mu_c = 2 * mu_b2 * c_s + mu_b1
+            else:
+                mu_c = _pow_neg_sigma(c_s, -sigma)
+            A = wnet[s] * mu_c
+            n_s, conv = _solve_n(A, chi_n_vec[s], l_tilde, b_ellip,
+                                 upsilon, eps_low, eps_high, n_b1,
+                                 n_b2, n_d1, n_d2, l_tilde / 2)
+            if not conv:
+                ok = False
+            nvec[s] = n_s
+        bvec[0] = b_init
+        for s in range(1, p):
+            bvec[s] = (one_p_rnet[s - 1] * bvec[s - 1] +
+                       wnet[s - 1] * nvec[s - 1] - cvec[s - 1] +
+                       xpath[s - 1])
+        if p > 1:
+            x_last = xpath[p - 2]
+        else:
+            x_last = xpath[p - 1]
+        b_Sp1 = (one_p_rnet[p - 1] * bvec[p - 1] +
+                 wnet[p - 1] * nvec[p - 1] - cvec[p - 1] + x_last)
+
+        return b_Sp1, ok
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _cnb_last_core(c1, cum_growth, one_p_rnet, wnet, xpath, b_init,
+                       sigma, l_tilde, b_ellip, upsilon, chi_n_vec,
+                       epsilon, mu_b1, mu_b2, eps_low, eps_high, n_b1,
+                       n_b2, n_d1, n_d2):
+        '''
+        ----------------------------------------------------------------
+        Scalar-only variant of _cnb_core() for callers that consume
+        only the terminal savings b_Sp1, such as the root finders on
+        c1. The lifetime recursion is fused into a single loop that
+        carries the running savings balance and the previous period's
+        consumption and labor supply as scalars, so no path arrays are
+        allocated or written at all. Returns b_Sp1 and the same
+        convergence flag as _cnb_core()
+        ----------------------------------------------------------------
+        '''
+        p = cum_growth.shape[0]
+        ok = True
+        b = b_init
+        c_prev = 0.0
+        n_prev = 0.0
+        for s in range(p):
+            c_s = c1 * cum_growth[s]
+            if c_s < epsilon:
+                mu_c = 2 * mu_b2 * c_s + mu_b1
+            else:
+                mu_c = _pow_neg_sigma(c_s, -sigma)
+            A = wnet[s] * mu_c
+            n_s, conv = _solve_n(A, chi_n_vec[s], l_tilde, b_ellip,
+                                 upsilon, eps_low, eps_high, n_b1,
+                                 n_b2, n_d1, n_d2, l_tilde / 2)
+            if not conv:
+                ok = False
+            if s >= 1:
+                b = (one_p_rnet[s - 1] * b + wnet[s - 1] * n_prev -
+                     c_prev + xpath[s - 1])
+            c_prev = c_s
+            n_prev = n_s
+        if p > 1:
+            x_last = xpath[p - 2]
+        else:
+            x_last = xpath[p - 1]
+        b_Sp1 = (one_p_rnet[p - 1] * b + wnet[p - 1] * n_prev -
+                 c_prev + x_last)
+
+        return b_Sp1, ok
+
+    @njit(cache=True, fastmath=True, nogil=True, parallel=True)
+    def _cnb_batch_core(c1_vec, growth_mat, rnet_mat, wnet_mat, xmat,
+                        chi_mat, b_init_vec, p_vec, sigma, l_tilde,
+                        b_ellip, upsilon, epsilon, mu_b1, mu_b2,
+                        eps_low, eps_high, n_b1, n_b2, n_d1, n_d2,
+                        cmat, nmat, bmat, bSp1_vec, ok_vec):
+        '''
+        ----------------------------------------------------------------
+        Compiled batch kernel that runs _cnb_core() for H independent
+        households in parallel. Each household h has its remaining
+        lifetime of length p_vec[h] stored in the first p_vec[h]
+        columns of row h of the (H, S) growth-factor, net price,
+        transfer, and chi_n matrices, so every cohort's lifetime is
+        contiguous in memory and the cohort loop parallelizes with no
+        shared state. Writes the lifetime paths into the corresponding
+        rows of cmat, nmat, and bmat, the terminal savings into
+        bSp1_vec, and per-household convergence flags into ok_vec
+        ----------------------------------------------------------------
+        '''
+        H = c1_vec.shape[0]
+        for h in prange(H):
+            p = p_vec[h]
+            b_Sp1, ok = _cnb_core(c1_vec[h], growth_mat[h, :p],
+                                  rnet_mat[h, :p], wnet_mat[h, :p],
+                                  xmat[h, :p], b_init_vec[h], sigma,
+                                  l_tilde, b_ellip, upsilon,
+                                  chi_mat[h, :p], epsilon, mu_b1,
+                                  mu_b2, eps_low, eps_high, n_b1,
+                                  n_b2, n_d1, n_d2, cmat[h, :p],
+                                  nmat[h, :p], bmat[h, :p])
+            bSp1_vec[h] = b_Sp1
+            ok_vec[h] = ok
+
+
+@functools.lru_cache(maxsize=32)
+def _mu_c_stitch_coeffs(sigma, epsilon):
+    '''
+    --------------------------------------------------------------------
+    Compute the coefficients (b1, b2) of the linear function g'(c) that
+    is stitched onto the CRRA marginal utility of consumption below
+    epsilon in MU_c_stitch(). The coefficients depend only on sigma and
+    epsilon, which are fixed within a model solution, so the results
+    are memoized rather than recomputed on every call
+    --------------------------------------------------------------------
+    INPUTS:
+    sigma   = scalar >= 1, coefficient of relative risk aversion
+    epsilon = scalar > 0, positive value close to zero
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION: None
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    b1 = scalar, intercept value in linear marginal utility
+    b2 = scalar, slope coefficient in linear marginal utility
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: b1, b2
+    --------------------------------------------------------------------
+    '''
+    b2 = (-sigma * (epsilon ** (-sigma - 1))) / 2
+    b1 = (epsilon ** (-sigma)) - 2 * b2 * epsilon
+
+    return b1, b2
+
+
+@functools.lru_cache(maxsize=32)
+def _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low, eps_high):
+    '''
+    --------------------------------------------------------------------
+    Compute the coefficients (b1, b2) and (d1, d2) of the linear
+    functions g_low'(n) and g_high'(n) that are stitched onto the
+    elliptical marginal disutility of labor outside [eps_low, eps_high]
+    in MDU_n_stitch(). The coefficients depend only on the fixed
+    calibration parameters, so the results are memoized rather than
+    recomputed on every call
+    --------------------------------------------------------------------
+    INPUTS:
+    l_tilde  = scalar > 0, time endowment for each agent each period
+    b_ellip  = scalar > 0, scale parameter for elliptical utility
+               of leisure function
+    upsilon  = scalar > 1, shape parameter for elliptical utility
+               of leisure function
+    eps_low  = scalar > 0, positive value close to zero
+    eps_high = scalar > 0, positive value just less than l_tilde
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION: None
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    b1 = scalar, intercept value in linear marginal disutility of labor
+         at lower bound
+    b2 = scalar, slope coefficient in linear marginal disutility of
+         labor at lower bound
+    d1 = scalar, intercept value in linear marginal disutility of labor
+         at upper bound
+    d2 = scalar, slope coefficient in linear marginal disutility of
+         labor at upper bound
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: b1, b2, d1, d2
+    --------------------------------------------------------------------
+    '''
+    e_low_u = (eps_low / l_tilde) ** upsilon
+    one_m_e_low = 1 - e_low_u
+    pow_low = one_m_e_low ** ((1 - upsilon) / upsilon)
+    b2 = (0.5 * b_ellip * (l_tilde ** (-upsilon)) * (upsilon - 1) *
+          (eps_low ** (upsilon - 2)) * pow_low *
+          (1 + e_low_u * (one_m_e_low ** (-1))))
+    b1 = ((b_ellip / l_tilde) *
+          ((eps_low / l_tilde) ** (upsilon - 1)) * pow_low -
+          (2 * b2 * eps_low))
+    e_high_u = (eps_high / l_tilde) ** upsilon
+    one_m_e_high = 1 - e_high_u
+    pow_high = one_m_e_high ** ((1 - upsilon) / upsilon)
+    d2 = (0.5 * b_ellip * (l_tilde ** (-upsilon)) * (upsilon - 1) *
+          (eps_high ** (upsilon - 2)) * pow_high *
+          (1 + e_high_u * (one_m_e_high ** (-1))))
+    d1 = ((b_ellip / l_tilde) *
+          ((eps_high / l_tilde) ** (upsilon - 1)) * pow_high -
+          (2 * d2 * eps_high))
+
+    return b1, b2, d1, d2
+
 
 def get_cons(r, w, b, b_sp1, n, x, tax_params):
     '''
@@ -75,7 +497,7 @@ def get_cons(r, w, b, b_sp1, n, x, tax_params):
     return cons
 
 
-def MU_c_stitch(cvec, sigma, graph=False):
+def MU_c_stitch(cvec, sigma):
     '''
     --------------------------------------------------------------------
     Generate marginal utility(ies) of consumption with CRRA consumption
@@ -97,10 +519,9 @@ def MU_c_stitch(cvec, sigma, graph=False):
             lifetime consumption over p consecutive periods
     sigma = scalar >= 1, coefficient of relative risk aversion for CRRA
             utility function: (c**(1-sigma) - 1) / (1 - sigma)
-    graph = boolean, =True if want plot of stitched marginal utility of
-            consumption function
 
-    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION: None
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mu_c_stitch_coeffs()
 
     OBJECTS CREATED WITHIN FUNCTION:
     epsilon    = scalar > 0, positive value close to zero
@@ -111,10 +532,8 @@ def MU_c_stitch(cvec, sigma, graph=False):
     MU_c       = scalar or (p,) vector, marginal utility of consumption
                  or vector of marginal utilities of consumption
     p          = integer >= 1, number of periods remaining in lifetime
-    cvec_cnstr = (p,) boolean vector, =True for values of cvec < epsilon
 
-    FILES CREATED BY THIS FUNCTION:
-        MU_c_stitched.png
+    FILES CREATED BY THIS FUNCTION: None
 
     RETURNS: MU_c
     --------------------------------------------------------------------
@@ -124,72 +543,31 @@ def MU_c_stitch(cvec, sigma, graph=False):
         c_s = cvec
         c_s_cnstr = c_s < epsilon
         if c_s_cnstr:
-            b2 = (-sigma * (epsilon ** (-sigma - 1))) / 2
-            b1 = (epsilon ** (-sigma)) - 2 * b2 * epsilon
+            b1, b2 = _mu_c_stitch_coeffs(sigma, epsilon)
             MU_c = 2 * b2 * c_s + b1
         else:
             MU_c = c_s ** (-sigma)
     elif np.ndim(cvec) == 1:
         p = cvec.shape[0]
-        cvec_cnstr = cvec < epsilon
-        MU_c = np.zeros(p)
-        MU_c[~cvec_cnstr] = cvec[~cvec_cnstr] ** (-sigma)
-        b2 = (-sigma * (epsilon ** (-sigma - 1))) / 2
-        b1 = (epsilon ** (-sigma)) - 2 * b2 * epsilon
-        MU_c[cvec_cnstr] = 2 * b2 * cvec[cvec_cnstr] + b1
-
-    if graph:
-        '''
-        ----------------------------------------------------------------
-        cur_path    = string, path name of current directory
-        output_fldr = string, folder in current path to save files
-        output_dir  = string, total path of images folder
-        output_path = string, path of file name of figure to be saved
-        cvec_CRRA   = (1000,) vector, support of c including values
-                      between 0 and epsilon
-        MU_CRRA     = (1000,) vector, CRRA marginal utility of
-                      consumption
-        cvec_stitch = (500,) vector, stitched support of consumption
-                      including negative values up to epsilon
-        MU_stitch   = (500,) vector, stitched marginal utility of
-                      consumption
-        ----------------------------------------------------------------
-        '''
-        # Create directory if images directory does not already exist
-        cur_path = os.path.split(os.path.abspath(__file__))[0]
-        output_fldr = "images"
-        output_dir = os.path.join(cur_path, output_fldr)
-        if not os.access(output_dir, os.F_OK):
-            os.makedirs(output_dir)
-
-        # Plot steady-state consumption and savings distributions
-        cvec_CRRA = np.linspace(epsilon / 2, epsilon * 3, 1000)
-        MU_CRRA = cvec_CRRA ** (-sigma)
-        cvec_stitch = np.linspace(-0.00005, epsilon, 500)
-        MU_stitch = 2 * b2 * cvec_stitch + b1
-        fig, ax = plt.subplots()
-        plt.plot(cvec_CRRA, MU_CRRA, ls='solid', label='$u\'(c)$: CRRA')
-        plt.plot(cvec_stitch, MU_stitch, ls='dashed', color='red',
-                 label='$g\'(c)$: stitched')
-        # for the minor ticks, use no labels; default NullFormatter
-        minorLocator = MultipleLocator(1)
-        ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
-        plt.title('Marginal utility of consumption with stitched ' +
-                  'function', fontsize=14)
-        plt.xlabel(r'Consumption $c$')
-        plt.ylabel(r'Marginal utility $u\'(c)$')
-        plt.xlim((-0.00005, epsilon * 3))
-        # plt.ylim((-1.0, 1.15 * (b_ss.max())))
-        plt.legend(loc='upper right')
-        output_path = os.path.join(output_dir, "MU_c_stitched")
-        plt.savefig(output_path)
-        # plt.show()
+        b1, b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+        if njit is not None:
+            MU_c = _mu_c_stitch_vec(np.ascontiguousarray(cvec, dtype=float),
+                                    sigma, epsilon, b1, b2, np.empty(p))
+        else:
+            # Branchless form: both lanes are evaluated and np.where
+            # selects between them, which avoids building boolean
+            # masks and fancy indexing twice. Floating point errors
+            # from evaluating the CRRA lane at constrained values are
+            # suppressed because those lanes are discarded
+            with np.errstate(divide='ignore', invalid='ignore',
+                             over='ignore'):
+                MU_c = np.where(cvec < epsilon, 2 * b2 * cvec + b1,
+                                cvec ** (-sigma))
 
     return MU_c
 
 
-def MDU_n_stitch(nvec, params, graph=False):
+def MDU_n_stitch(nvec, params):
     '''
     --------------------------------------------------------------------
     Generate marginal disutility(ies) of labor with elliptical
@@ -218,10 +596,9 @@ def MDU_n_stitch(nvec, params, graph=False):
     nvec   = scalar or (p,) vector, labor supply value or labor supply
              values over remaining periods of lifetime
     params = length 3 tuple, (l_tilde, b_ellip, upsilon)
-    graph  = Boolean, =True if want plot of stitched marginal disutility
-             of labor function
 
-    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION: None
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mdu_n_stitch_coeffs()
 
     OBJECTS CREATED WITHIN FUNCTION:
     l_tilde       = scalar > 0, time endowment for each agent each per
@@ -252,8 +629,7 @@ def MDU_n_stitch(nvec, params, graph=False):
     nvec_s_uncstr = boolean, =True for n_s >= eps_low and
                     n_s <= eps_high
 
-    FILES CREATED BY THIS FUNCTION:
-        MDU_n_stitched.png
+    FILES CREATED BY THIS FUNCTION: None
 
     RETURNS: MDU_n
     --------------------------------------------------------------------
@@ -268,133 +644,170 @@ def MDU_n_stitch(nvec, params, graph=False):
         n_s_high = n_s > eps_high
         n_s_uncstr = (n_s >= eps_low) and (n_s <= eps_high)
         if n_s_uncstr:
-            MDU_n = \
-                ((b_ellip / l_tilde) * ((n_s / l_tilde) **
-                 (upsilon - 1)) * ((1 - ((n_s / l_tilde) ** upsilon)) **
-                 ((1 - upsilon) / upsilon)))
+            x_n = n_s / l_tilde
+            MDU_n = ((b_ellip / l_tilde) * (x_n ** (upsilon - 1)) *
+                     ((1 - (x_n ** upsilon)) **
+                      ((1 - upsilon) / upsilon)))
         elif n_s_low:
-            b2 = (0.5 * b_ellip * (l_tilde ** (-upsilon)) *
-                  (upsilon - 1) * (eps_low ** (upsilon - 2)) *
-                  ((1 - ((eps_low / l_tilde) ** upsilon)) **
-                  ((1 - upsilon) / upsilon)) *
-                  (1 + ((eps_low / l_tilde) ** upsilon) *
-                  ((1 - ((eps_low / l_tilde) ** upsilon)) ** (-1))))
-            b1 = ((b_ellip / l_tilde) * ((eps_low / l_tilde) **
-                  (upsilon - 1)) *
-                  ((1 - ((eps_low / l_tilde) ** upsilon)) **
-                  ((1 - upsilon) / upsilon)) - (2 * b2 * eps_low))
+            b1, b2, d1, d2 = \
+                _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                     eps_high)
             MDU_n = 2 * b2 * n_s + b1
         elif n_s_high:
-            d2 = (0.5 * b_ellip * (l_tilde ** (-upsilon)) *
-                  (upsilon - 1) * (eps_high ** (upsilon - 2)) *
-                  ((1 - ((eps_high / l_tilde) ** upsilon)) **
-                  ((1 - upsilon) / upsilon)) *
-                  (1 + ((eps_high / l_tilde) ** upsilon) *
-                  ((1 - ((eps_high / l_tilde) ** upsilon)) ** (-1))))
-            d1 = ((b_ellip / l_tilde) * ((eps_high / l_tilde) **
-                  (upsilon - 1)) *
-                  ((1 - ((eps_high / l_tilde) ** upsilon)) **
-                  ((1 - upsilon) / upsilon)) - (2 * d2 * eps_high))
+            b1, b2, d1, d2 = \
+                _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                     eps_high)
             MDU_n = 2 * d2 * n_s + d1
     # This if is for when nvec is a one-dimensional vector
     elif np.ndim(nvec) == 1:
         p = nvec.shape[0]
-        nvec_low = nvec < eps_low
-        nvec_high = nvec > eps_high
-        nvec_uncstr = np.logical_and(~nvec_low, ~nvec_high)
-        MDU_n = np.zeros(p)
-        MDU_n[nvec_uncstr] = (
-            (b_ellip / l_tilde) *
-            ((nvec[nvec_uncstr] / l_tilde) ** (upsilon - 1)) *
-            ((1 - ((nvec[nvec_uncstr] / l_tilde) ** upsilon)) **
-             ((1 - upsilon) / upsilon)))
-        b2 = (0.5 * b_ellip * (l_tilde ** (-upsilon)) * (upsilon - 1) *
-              (eps_low ** (upsilon - 2)) *
-              ((1 - ((eps_low / l_tilde) ** upsilon)) **
-              ((1 - upsilon) / upsilon)) *
-              (1 + ((eps_low / l_tilde) ** upsilon) *
-              ((1 - ((eps_low / l_tilde) ** upsilon)) ** (-1))))
-        b1 = ((b_ellip / l_tilde) * ((eps_low / l_tilde) **
-              (upsilon - 1)) *
-              ((1 - ((eps_low / l_tilde) ** upsilon)) **
-              ((1 - upsilon) / upsilon)) - (2 * b2 * eps_low))
-        MDU_n[nvec_low] = 2 * b2 * nvec[nvec_low] + b1
-        d2 = (0.5 * b_ellip * (l_tilde ** (-upsilon)) * (upsilon - 1) *
-              (eps_high ** (upsilon - 2)) *
-              ((1 - ((eps_high / l_tilde) ** upsilon)) **
-              ((1 - upsilon) / upsilon)) *
-              (1 + ((eps_high / l_tilde) ** upsilon) *
-              ((1 - ((eps_high / l_tilde) ** upsilon)) ** (-1))))
-        d1 = ((b_ellip / l_tilde) * ((eps_high / l_tilde) **
-              (upsilon - 1)) *
-              ((1 - ((eps_high / l_tilde) ** upsilon)) **
-              ((1 - upsilon) / upsilon)) - (2 * d2 * eps_high))
-        MDU_n[nvec_high] = 2 * d2 * nvec[nvec_high] + d1
-
-    if graph:
-        '''
-        ----------------------------------------------------------------
-        cur_path    = string, path name of current directory
-        output_fldr = string, folder in current path to save files
-        output_dir  = string, total path of images folder
-        output_path = string, path of file name of figure to be saved
-        nvec_ellip  = (1000,) vector, support of n including values
-                      between 0 and eps_low and between eps_high and
-                      l_tilde
-        MU_CRRA     = (1000,) vector, CRRA marginal utility of
-                      consumption
-        cvec_stitch = (500,) vector, stitched support of consumption
-                      including negative values up to epsilon
-        MU_stitch   = (500,) vector, stitched marginal utility of
-                      consumption
-        ----------------------------------------------------------------
-        '''
-        # Create directory if images directory does not already exist
-        cur_path = os.path.split(os.path.abspath(__file__))[0]
-        output_fldr = "images"
-        output_dir = os.path.join(cur_path, output_fldr)
-        if not os.access(output_dir, os.F_OK):
-            os.makedirs(output_dir)
-
-        # Plot steady-state consumption and savings distributions
-        nvec_ellip = np.linspace(eps_low / 2, eps_high +
-                                 ((l_tilde - eps_high) / 5), 1000)
-        MDU_ellip = (
-            (b_ellip / l_tilde) *
-            ((nvec_ellip / l_tilde) ** (upsilon - 1)) *
-            ((1 - ((nvec_ellip / l_tilde) ** upsilon)) **
-             ((1 - upsilon) / upsilon)))
-        n_stitch_low = np.linspace(-0.05, eps_low, 500)
-        MDU_stitch_low = 2 * b2 * n_stitch_low + b1
-        n_stitch_high = np.linspace(eps_high, l_tilde + 0.000005, 500)
-        MDU_stitch_high = 2 * d2 * n_stitch_high + d1
-        fig, ax = plt.subplots()
-        plt.plot(nvec_ellip, MDU_ellip, ls='solid', color='black',
-                 label='$v\'(n)$: Elliptical')
-        plt.plot(n_stitch_low, MDU_stitch_low, ls='dashed', color='red',
-                 label='$g\'(n)$: low stitched')
-        plt.plot(n_stitch_high, MDU_stitch_high, ls='dotted',
-                 color='blue', label='$g\'(n)$: high stitched')
-        # for the minor ticks, use no labels; default NullFormatter
-        minorLocator = MultipleLocator(1)
-        ax.xaxis.set_minor_locator(minorLocator)
-        plt.grid(b=True, which='major', color='0.65', linestyle='-')
-        plt.title('Marginal utility of consumption with stitched ' +
-                  'function', fontsize=14)
-        plt.xlabel(r'Labor $n$')
-        plt.ylabel(r'Marginal disutility $v\'(n)$')
-        plt.xlim((-0.05, l_tilde + 0.01))
-        # plt.ylim((-1.0, 1.15 * (b_ss.max())))
-        plt.legend(loc='upper left')
-        output_path = os.path.join(output_dir, "MDU_n_stitched")
-        plt.savefig(output_path)
-        # plt.show()
+        b1, b2, d1, d2 = \
+            _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                 eps_high)
+        if njit is not None:
+            MDU_n = _mdu_n_stitch_vec(
+                np.ascontiguousarray(nvec, dtype=float), l_tilde, b_ellip,
+                upsilon, eps_low, eps_high, b1, b2, d1, d2, np.empty(p))
+        else:
+            # Branchless form: np.select picks among the three lanes
+            # without building separate masks for fancy indexing.
+            # Floating point errors from evaluating the elliptical
+            # lane at constrained values are suppressed because those
+            # lanes are discarded
+            with np.errstate(divide='ignore', invalid='ignore',
+                             over='ignore'):
+                x_n = nvec / l_tilde
+                x_nu = x_n ** upsilon
+                MDU_n = np.select(
+                    [nvec < eps_low, nvec > eps_high],
+                    [2 * b2 * nvec + b1, 2 * d2 * nvec + d1],
+                    default=((b_ellip / l_tilde) *
+                             (x_n ** (upsilon - 1)) *
+                             ((1 - x_nu) **
+                              ((1 - upsilon) / upsilon))))
 
     return MDU_n
 
 
+def _mdu_n_stitch_deriv(nvec, l_tilde, b_ellip, upsilon, eps_low,
+                        eps_high, b2, d2):
+    '''
+    --------------------------------------------------------------------
+    Derivative of the stitched marginal disutility of labor
+    MDU_n_stitch() with respect to labor supply, evaluated elementwise
+    over a vector of labor supplies. The derivative is 2 * b2 on the
+    lower stitched lane, 2 * d2 on the upper stitched lane, and
+
+    v''(n) = (b / l_tilde ** 2) * (upsilon - 1) *
+             ((n / l_tilde) ** (upsilon - 2)) *
+             ((1 - ((n / l_tilde) ** upsilon)) **
+              ((1 - upsilon) / upsilon)) *
+             (1 + (((n / l_tilde) ** upsilon) /
+                   (1 - ((n / l_tilde) ** upsilon))))
+
+    on the elliptical interior. The derivative is strictly positive
+    everywhere, which is what makes Newton's method on the labor
+    supply FOC globally well behaved
+    --------------------------------------------------------------------
+    INPUTS:
+    nvec     = (p,) vector, labor supply values
+    l_tilde  = scalar > 0, time endowment for each agent each period
+    b_ellip  = scalar > 0, scale parameter for elliptical utility
+    upsilon  = scalar > 1, shape parameter for elliptical utility
+    eps_low  = scalar > 0, lower bound of elliptical interior
+    eps_high = scalar > 0, upper bound of elliptical interior
+    b2       = scalar, slope coefficient of lower stitched function
+    d2       = scalar, slope coefficient of upper stitched function
 
-def get_n_errors(nvec, args):
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION: None
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    x_n    = (p,) vector, nvec / l_tilde
+    x_nu   = (p,) vector, x_n ** upsilon
+    dMDU_n = (p,) vector, derivative of stitched marginal disutility
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: dMDU_n
+    --------------------------------------------------------------------
+    '''
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        x_n = nvec / l_tilde
+        x_nu = x_n ** upsilon
+        dMDU_n = np.select(
+            [nvec < eps_low, nvec > eps_high],
+            [2 * b2, 2 * d2],
+            default=((b_ellip / (l_tilde ** 2)) * (upsilon - 1) *
+                     (x_n ** (upsilon - 2)) *
+                     ((1 - x_nu) ** ((1 - upsilon) / upsilon)) *
+                     (1 + (x_nu / (1 - x_nu)))))
+
+    return dMDU_n
+
+
+def _batched_solve_n(A, chi_n_vec, l_tilde, b_ellip, upsilon):
+    '''
+    --------------------------------------------------------------------
+    Solve the intratemporal labor supply FOCs for all remaining periods
+    of life at once, A_s = chi_n_s * v'(n_s), by a batched Newton
+    iteration on the whole vector, where A_s = (1 - tau_l) * w_s *
+    u'(c_s) is fixed during the solve. The FOCs are independent across
+    ages once the consumption path is known, so one vectorized Newton
+    step updates every age simultaneously and the p scipy root-finder
+    dispatches collapse into a handful of NumPy ufunc evaluations.
+    Returns the solution vector and an elementwise convergence flag so
+    the caller can fall back on a library root finder for any age that
+    did not converge
+    --------------------------------------------------------------------
+    INPUTS:
+    A         = (p,) vector, after-tax wage times marginal utility of
+                consumption by age
+    chi_n_vec = (p,) vector, values for chi^n_s
+    l_tilde   = scalar > 0, time endowment for each agent each period
+    b_ellip   = scalar > 0, scale parameter for elliptical utility
+    upsilon   = scalar > 1, shape parameter for elliptical utility
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mdu_n_stitch_coeffs()
+        _mdu_n_stitch_deriv()
+        MDU_n_stitch()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    eps_low   = scalar > 0, positive value close to zero
+    eps_high  = scalar > 0, positive value just less than l_tilde
+    nvec      = (p,) vector, labor supply Newton iterate
+    tol       = (p,) vector, elementwise convergence tolerance
+    resid     = (p,) vector, labor supply FOC residuals
+    converged = (p,) Boolean vector, =True where |resid| <= tol
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: nvec, converged
+    --------------------------------------------------------------------
+    '''
+    eps_low = 0.000001
+    eps_high = l_tilde - 0.000001
+    b1, b2, d1, d2 = \
+        _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                             eps_high)
+    mdun_params = (l_tilde, b_ellip, upsilon)
+    nvec = np.full(A.shape[0], l_tilde / 2)
+    tol = 1e-14 * np.maximum(1.0, np.abs(A))
+    for it in range(50):
+        resid = A - chi_n_vec * MDU_n_stitch(nvec, mdun_params)
+        converged = np.abs(resid) <= tol
+        if converged.all():
+            break
+        nvec = nvec + resid / (chi_n_vec *
+                               _mdu_n_stitch_deriv(nvec, l_tilde,
+                                                   b_ellip, upsilon,
+                                                   eps_low, eps_high,
+                                                   b2, d2))
+
+    return nvec, converged
+
+
+def get_n_errors(nvec, args, mu_c=None):
     '''
     --------------------------------------------------------------------
     Generates vector of static Euler errors that characterize the
@@ -424,13 +837,18 @@ def get_n_errors(nvec, args):
                 nvec
     diff      = Boolean, =True if use simple difference Euler errors.
                 Use percent difference errors otherwise.
+    mu_c      = (p,) vector or None, optional precomputed marginal
+                utility of consumption for cvec. Passing it in lets a
+                caller that has already evaluated MU_c_stitch(cvec,
+                sigma) avoid a redundant evaluation
 
     OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
         MU_c_stitch()
         MDU_n_stitch()
 
     OBJECTS CREATED WITHIN FUNCTION:
-    mu_c     = (p,) vector, marginal utility of consumption
+    mu_c     = (p,) vector, marginal utility of consumption, either
+               passed in precomputed or computed from cvec
     mu_n     = (p,) vector, marginal utility of labor supply
     n_errors = (p,) vector, Euler errors characterizing optimal labor
                supply nvec
@@ -441,7 +859,8 @@ def get_n_errors(nvec, args):
     --------------------------------------------------------------------
     '''
     w, cvec, sigma, l_tilde, chi_n_vec, b_ellip, upsilon, tau_l, diff = args
-    mu_c = MU_c_stitch(cvec, sigma)
+    if mu_c is None:
+        mu_c = MU_c_stitch(cvec, sigma)
     mdun_params = (l_tilde, b_ellip, upsilon)
     mdu_n = MDU_n_stitch(nvec, mdun_params)
     if diff:
@@ -452,7 +871,7 @@ def get_n_errors(nvec, args):
     return n_errors
 
 
-def get_b_errors(params, r, cvec, diff):
+def get_b_errors(params, r, cvec, diff, mu_c=None, mu_cp1=None):
     '''
     --------------------------------------------------------------------
     Generates vector of dynamic Euler errors that characterize the
@@ -472,6 +891,10 @@ def get_b_errors(params, r, cvec, diff):
     cvec    = (p,) vector, distribution of consumption by age c_p
     diff    = boolean, =True if use simple difference Euler
               errors. Use percent difference errors otherwise.
+    mu_c    = (p-1,) vector or None, optional precomputed marginal
+              utility of consumption for cvec[:-1]
+    mu_cp1  = (p-1,) vector or None, optional precomputed marginal
+              utility of consumption for cvec[1:]
 
     OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
         MU_c_stitch()
@@ -488,8 +911,10 @@ def get_b_errors(params, r, cvec, diff):
     --------------------------------------------------------------------
     '''
     beta, sigma, tau_k = params
-    mu_c = MU_c_stitch(cvec[:-1], sigma)
-    mu_cp1 = MU_c_stitch(cvec[1:], sigma)
+    if mu_c is None:
+        mu_c = MU_c_stitch(cvec[:-1], sigma)
+    if mu_cp1 is None:
+        mu_cp1 = MU_c_stitch(cvec[1:], sigma)
     if diff:
         b_errors = (beta * (1 + (1-tau_k)*r) * mu_cp1) - mu_c
     else:
@@ -498,13 +923,25 @@ def get_b_errors(params, r, cvec, diff):
     return b_errors
 
 
-def bn_solve(guesses, *args):
+def bn_solve(guesses, *args, shoot_mode=False):
     '''
     --------------------------------------------------------------------
     Finds the euler errors for certain b and n, one ability type at a time.
+
+    When shoot_mode=True, the savings Euler equations are imposed
+    exactly through the closed-form consumption path rather than
+    guessed and checked: guesses is the (S+1,) vector (c_1, n_1, ...,
+    n_S), consumption grows at the intertemporal Euler rate
+    (beta * (1 + (1 - tau_k) * r)) ** (1 / sigma) from c_1, savings
+    follow from the budget constraints, and the returned system is the
+    (S,) labor supply Euler errors plus the terminal savings error
+    b_{S+1}, which should be zero in equilibrium. This shrinks the
+    root-finding system from 2S-1 to S+1 equations and skips the
+    savings Euler error computation entirely
     --------------------------------------------------------------------
     INPUTS:
-    guesses = (2S-1,) vector, initial guesses for b and n
+    guesses = (2S-1,) vector, initial guesses for b and n, or (S+1,)
+              vector (c_1, n_1, ..., n_S) if shoot_mode=True
     params  = length 12 tuple, r, w, x, S, beta, sigma, l_tilde, b_ellip,
               upsilon, chi_n_vec, tax_params , diff
 
@@ -545,31 +982,287 @@ def bn_solve(guesses, *args):
 
     FILES CREATED BY THIS FUNCTION: None
 
-    RETURNS: 2S-1 length list of error1 and error2
+    RETURNS: (2S-1,) vector of error1 and error2, or (S+1,) vector of
+             n_errors and terminal savings error if shoot_mode=True
     --------------------------------------------------------------------
     '''
     (r, w, x, S, beta, sigma, l_tilde, b_ellip, upsilon, chi_n_vec,
         tax_params, diff) = args
     tau_l, tau_k, tau_c = tax_params
-    b_guess = np.append(np.array(guesses[:S - 1]), 0.0)
-    n_guess = np.array(guesses[S - 1:])
-    b_s = np.array([0] + list(b_guess[:-1]))
+    guesses = np.asarray(guesses)
+    if shoot_mode:
+        c1 = guesses[0]
+        n_guess = guesses[1:]
+        # The consumption path satisfies the savings Euler equations by
+        # construction, so their errors are identically zero and only
+        # the terminal savings b_{S+1} must be checked
+        growth = (beta * (1 + (1 - tau_k) * r)) ** (1 / sigma)
+        cvec = c1 * growth ** np.arange(S)
+        bvec = np.zeros(S)
+        for s in range(1, S):
+            bvec[s] = ((1 + (1 - tau_k) * r) * bvec[s - 1] +
+                       (1 - tau_l) * w * n_guess[s - 1] -
+                       cvec[s - 1] + x)
+        b_Sp1 = ((1 + (1 - tau_k) * r) * bvec[-1] +
+                 (1 - tau_l) * w * n_guess[-1] - cvec[-1] + x)
+        n_args = (w, cvec, sigma, l_tilde, chi_n_vec, b_ellip, upsilon,
+                  tau_l, diff)
+        n_errors = get_n_errors(n_guess, n_args)
+
+        return np.append(n_errors, b_Sp1)
+    b_guess = np.empty(S)
+    b_guess[:S - 1] = guesses[:S - 1]
+    b_guess[S - 1] = 0.0
+    n_guess = guesses[S - 1:]
+    if njit is not None and np.ndim(r) == 0 and np.ndim(w) == 0:
+        epsilon = 0.0001
+        eps_low = 0.000001
+        eps_high = l_tilde - 0.000001
+        mu_b1, mu_b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+        n_b1, n_b2, n_d1, n_d2 = \
+            _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                 eps_high)
+        # The output array must be freshly allocated each call because
+        # MINPACK holds a reference to the returned residual vector
+        # across iterations, so returning a view of a reused buffer
+        # corrupts the solve
+        out = np.empty(2 * S - 1)
+        return _bn_residual(b_guess, n_guess, float(r), float(w),
+                            float(x), beta, sigma, tau_l, tau_k,
+                            l_tilde, b_ellip, upsilon,
+                            np.ascontiguousarray(chi_n_vec, dtype=float),
+                            diff, epsilon, mu_b1, mu_b2, eps_low,
+                            eps_high, n_b1, n_b2, n_d1, n_d2, out)
+    b_s = np.empty(S)
+    b_s[0] = 0.0
+    b_s[1:] = b_guess[:-1]
     b_splus1 = b_guess
 
     cons = get_cons(r, w, b_s, b_splus1, n_guess, x, tax_params)
+    # Evaluate the stitched marginal utility of consumption once over
+    # the full lifetime and slice it into both Euler equations rather
+    # than evaluating overlapping segments three times
+    mu_c_all = MU_c_stitch(cons, sigma)
     b_params = (beta, sigma, tau_k)
-    error1 = get_b_errors(b_params, r, cons, diff)
+    error1 = get_b_errors(b_params, r, cons, diff, mu_c=mu_c_all[:-1],
+                          mu_cp1=mu_c_all[1:])
 
     n_args = (w, cons, sigma, l_tilde, chi_n_vec, b_ellip, upsilon, tau_l, diff)
-    error2 = get_n_errors(n_guess, n_args)
+    error2 = get_n_errors(n_guess, n_args, mu_c=mu_c_all)
+
+    return np.concatenate((error1, error2))
+
+
+# Cache of specialized bn_solve residual/Jacobian closures keyed on the
+# calibration constants, so repeated inner-loop calls with the same
+# calibration reuse one closure instead of rebuilding it
+_bn_residual_cache = {}
+
+
+def make_bn_residual(S, chi_n_vec, beta, sigma, l_tilde, b_ellip,
+                     upsilon, tax_params, diff):
+    '''
+    --------------------------------------------------------------------
+    Build a residual function and Jacobian for the bn_solve() Euler
+    error system specialized on a fixed calibration. Within a model
+    solution only the prices (r, w, x) change between root-finder
+    calls, so the lifetime length, preference parameters, tax rates,
+    and stitch coefficients are captured once in a closure rather than
+    unpacked from an args tuple on every residual evaluation. Closures
+    are cached per calibration
+    --------------------------------------------------------------------
+    INPUTS:
+    S          = integer in [3, 80], number of periods an individual
+                 lives
+    chi_n_vec  = (S,) vector, values for chi^n_s
+    beta       = scalar in (0,1), discount factor for each model period
+    sigma      = scalar > 0, coefficient of relative risk aversion
+    l_tilde    = scalar > 0, time endowment for each agent each period
+    b_ellip    = scalar > 0, fitted value of b for elliptical
+                 disutility of labor
+    upsilon    = scalar > 1, fitted value of upsilon for elliptical
+                 disutility of labor
+    tax_params = length 3 tuple, (tau_l, tau_k, tau_c)
+    diff       = boolean, =True if use simple difference Euler errors.
+                 Use percent difference errors otherwise.
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mu_c_stitch_coeffs()
+        _mdu_n_stitch_coeffs()
+        bn_solve()
+        bn_jac()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    bn_residual = function, residual of the Euler error system with
+                  signature (guesses, r, w, x)
+    bn_jacobian = function, Jacobian of the Euler error system with
+                  signature (guesses, r, w, x)
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: bn_residual, bn_jacobian
+    --------------------------------------------------------------------
+    '''
+    tau_l, tau_k, tau_c = tax_params
+    key = (S, tuple(np.asarray(chi_n_vec).tolist()), beta, sigma,
+           l_tilde, b_ellip, upsilon, tau_l, tau_k, tau_c, diff)
+    cached = _bn_residual_cache.get(key)
+    if cached is not None:
+        return cached
+    chi_n_arr = np.ascontiguousarray(chi_n_vec, dtype=float)
+    if njit is not None:
+        epsilon = 0.0001
+        eps_low = 0.000001
+        eps_high = l_tilde - 0.000001
+        mu_b1, mu_b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+        n_b1, n_b2, n_d1, n_d2 = \
+            _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                 eps_high)
+
+        def bn_residual(guesses, r, w, x):
+            guesses = np.asarray(guesses)
+            b_guess = np.empty(S)
+            b_guess[:S - 1] = guesses[:S - 1]
+            b_guess[S - 1] = 0.0
+            out = np.empty(2 * S - 1)
+            return _bn_residual(b_guess, guesses[S - 1:], float(r),
+                                float(w), float(x), beta, sigma, tau_l,
+                                tau_k, l_tilde, b_ellip, upsilon,
+                                chi_n_arr, diff, epsilon, mu_b1, mu_b2,
+                                eps_low, eps_high, n_b1, n_b2, n_d1,
+                                n_d2, out)
+    else:
+
+        def bn_residual(guesses, r, w, x):
+            return bn_solve(guesses, r, w, x, S, beta, sigma, l_tilde,
+                            b_ellip, upsilon, chi_n_arr, tax_params,
+                            diff)
+
+    def bn_jacobian(guesses, r, w, x):
+        return bn_jac(guesses, r, w, x, S, beta, sigma, l_tilde,
+                      b_ellip, upsilon, chi_n_arr, tax_params, diff)
+
+    _bn_residual_cache[key] = (bn_residual, bn_jacobian)
+
+    return bn_residual, bn_jacobian
+
+
+def bn_jac(guesses, *args):
+    '''
+    --------------------------------------------------------------------
+    Analytic Jacobian of the bn_solve() Euler error system with respect
+    to the (2S-1,) vector of savings and labor supply guesses. Passing
+    this to the root finder replaces the 2S-1 finite-difference
+    residual evaluations per iteration with a single assembly of the
+    banded derivative structure of the first order conditions
+    --------------------------------------------------------------------
+    INPUTS:
+    guesses = (2S-1,) vector, guesses for b and n
+    args    = length 12 tuple, (r, w, x, S, beta, sigma, l_tilde,
+              b_ellip, upsilon, chi_n_vec, tax_params, diff), identical
+              to the args of bn_solve()
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mu_c_stitch_coeffs()
+        _mdu_n_stitch_coeffs()
+        get_cons()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    cons  = (S,) vector, household consumption by age
+    mu_c  = (S,) vector, stitched marginal utility of consumption
+    dmu_c = (S,) vector, derivative of stitched marginal utility of
+            consumption with respect to consumption
+    mdu_n = (S,) vector, stitched marginal disutility of labor
+    dmdu_n = (S,) vector, derivative of stitched marginal disutility of
+             labor with respect to labor supply
+    jac   = (2S-1, 2S-1) matrix, Jacobian of the Euler error system
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: jac
+    --------------------------------------------------------------------
+    '''
+    (r, w, x, S, beta, sigma, l_tilde, b_ellip, upsilon, chi_n_vec,
+        tax_params, diff) = args
+    tau_l, tau_k, tau_c = tax_params
+    guesses = np.asarray(guesses)
+    b_guess = np.empty(S)
+    b_guess[:S - 1] = guesses[:S - 1]
+    b_guess[S - 1] = 0.0
+    n_guess = guesses[S - 1:]
+    b_s = np.empty(S)
+    b_s[0] = 0.0
+    b_s[1:] = b_guess[:-1]
+    cons = get_cons(r, w, b_s, b_guess, n_guess, x, tax_params)
+
+    epsilon = 0.0001
+    eps_low = 0.000001
+    eps_high = l_tilde - 0.000001
+    mu_b1, mu_b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+    n_b1, n_b2, n_d1, n_d2 = \
+        _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                             eps_high)
+    R = 1 + (1 - tau_k) * r
+    wn = (1 - tau_l) * w
+
+    # Stitched marginal utilities and their derivatives
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        mu_c = np.where(cons < epsilon, 2 * mu_b2 * cons + mu_b1,
+                        cons ** (-sigma))
+        dmu_c = np.where(cons < epsilon, 2 * mu_b2,
+                         -sigma * cons ** (-sigma - 1))
+        x_n = n_guess / l_tilde
+        x_nu = x_n ** upsilon
+        one_m_xnu = 1 - x_nu
+        pow_int = one_m_xnu ** ((1 - upsilon) / upsilon)
+        mdu_n = np.select(
+            [n_guess < eps_low, n_guess > eps_high],
+            [2 * n_b2 * n_guess + n_b1, 2 * n_d2 * n_guess + n_d1],
+            default=(b_ellip / l_tilde) * (x_n ** (upsilon - 1)) *
+            pow_int)
+        dmdu_n = np.select(
+            [n_guess < eps_low, n_guess > eps_high],
+            [2 * n_b2 * np.ones(S), 2 * n_d2 * np.ones(S)],
+            default=(b_ellip / (l_tilde ** 2)) * (upsilon - 1) *
+            (x_n ** (upsilon - 2)) * pow_int * (1 + x_nu / one_m_xnu))
+
+    # Derivatives of each error with respect to consumption and the
+    # direct derivative of the labor errors with respect to labor
+    if diff:
+        dn_dcons = wn * dmu_c
+        dn_dn = -chi_n_vec * dmdu_n
+        db_dconsp1 = beta * R * dmu_c[1:]
+        db_dcons = -dmu_c[:-1]
+    else:
+        dn_dcons = wn * dmu_c / (chi_n_vec * mdu_n)
+        dn_dn = -wn * mu_c * dmdu_n / (chi_n_vec * mdu_n ** 2)
+        db_dconsp1 = beta * R * dmu_c[1:] / mu_c[:-1]
+        db_dcons = -beta * R * mu_c[1:] * dmu_c[:-1] / (mu_c[:-1] ** 2)
+
+    # Chain rule through the budget constraint:
+    # d(cons_s)/d(b_s) = R, d(cons_s)/d(b_sp1) = -1, d(cons_s)/d(n_s) = wn
+    jac = np.zeros((2 * S - 1, 2 * S - 1))
+    s_all = np.arange(S)
+    s_mid = np.arange(1, S)
+    # Labor supply error rows (S-1 to 2S-2)
+    jac[S - 1 + s_all, S - 1 + s_all] = dn_dcons * wn + dn_dn
+    jac[S - 1 + s_mid, s_mid - 1] = dn_dcons[1:] * R
+    jac[S - 1 + s_all[:-1], s_all[:-1]] = -dn_dcons[:-1]
+    # Savings error rows (0 to S-2); row s-1 involves cons_s, cons_s-1
+    jac[s_mid - 1, s_mid - 1] += db_dconsp1 * R - db_dcons
+    jac[s_mid[:-1] - 1, s_mid[:-1]] += -db_dconsp1[:-1]
+    jac[s_mid - 1, S - 1 + s_mid] += db_dconsp1 * wn
+    jac[s_mid[1:] - 1, s_mid[1:] - 2] += db_dcons[1:] * R
+    jac[s_mid - 1, S - 1 + s_mid - 1] += db_dcons * wn
 
-    return list(error1.flatten()) + list(error2.flatten())
+    return jac
 
 
 
 
 
-def get_cnb_vecs(c_init, rpath, wpath, xpath, params):
+def get_cnb_vecs(c_init, rpath, wpath, xpath, params, out=None,
+                 precomp=None, return_paths=True):
     '''
     --------------------------------------------------------------------
     Generate lifetime consumption vector for individual given a guess
@@ -588,9 +1281,28 @@ def get_cnb_vecs(c_init, rpath, wpath, xpath, params):
     xpath  = (p,) vector, path of transfers over lifetime
     params = length 8 tuple, (b_init, beta, sigma, l_tilde, b_ellip,
              upsilon, chi_n_vec, diff)
+    out    = length 3 tuple or None, optional caller-supplied (cvec,
+             nvec, bvec) buffers of length p. When passed, the paths
+             are written into these buffers instead of freshly
+             allocated arrays, so a caller that discards the paths
+             (e.g. a root finder on b_Sp1) can reuse one set of
+             buffers across thousands of calls
+    precomp = length 3 tuple or None, optional precomputed
+              (cum_growth, one_p_rnet, wnet) arrays of length p: the
+              cumulative Euler growth factors, 1 + (1 - tau_k) *
+              rpath, and (1 - tau_l) * wpath. These depend only on the
+              paths, not on c_init, so a root finder varying c_init
+              can hoist them out of its iterations
+    return_paths = boolean, =True if the lifetime paths (cvec, nvec,
+                   bvec) are returned along with b_Sp1. When False,
+                   only the scalar b_Sp1 is computed and returned,
+                   carrying the lifetime recursion in scalars without
+                   allocating or writing any path arrays
 
     OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
-        get_n_s()
+        MU_c_stitch()
+        _batched_solve_n()
+        get_n_errors()
 
     OBJECTS CREATED WITHIN FUNCTION:
     b_init    = scalar, initial wealth b_{S-p+1}
@@ -620,43 +1332,118 @@ def get_cnb_vecs(c_init, rpath, wpath, xpath, params):
 
     FILES CREATED BY THIS FUNCTION: None
 
-    RETURNS: cvec, nvec, bvec, b_Sp1
+    RETURNS: (cvec, nvec, bvec, b_Sp1) or b_Sp1 if return_paths=False
     --------------------------------------------------------------------
     '''
     (b_init, beta, sigma, l_tilde, b_ellip, upsilon, chi_n_vec, tax_params,
         diff) = params
     tau_l, tau_k, tau_c = tax_params
     p = rpath.shape[0]
-    cvec = np.zeros(p)
-    nvec = np.zeros(p)
-    bvec = np.zeros(p)
+    # Buffer allocation is deferred until a code path that writes the
+    # lifetime paths actually runs, so the b_Sp1-only fast path below
+    # touches no arrays at all
+    if out is None:
+        cvec = nvec = bvec = None
+    else:
+        cvec, nvec, bvec = out
+    if precomp is None:
+        # The Euler growth factors and net-of-tax prices depend only on
+        # the paths and calibration, not on c_init, so a caller that
+        # varies c_init inside a root finder can hoist them out of the
+        # iteration and pass them in
+        one_p_rnet = 1 + (1 - tau_k) * np.asarray(rpath, dtype=float)
+        wnet = (1 - tau_l) * np.asarray(wpath, dtype=float)
+        cum_growth = np.cumprod(
+            np.append(1.0, (beta * one_p_rnet[1:]) ** (1 / sigma)))
+    else:
+        cum_growth, one_p_rnet, wnet = precomp
+    if njit is not None:
+        # Explode the parameter tuple at this boundary so the compiled
+        # core receives plain typed scalars and ndarrays
+        epsilon = 0.0001
+        eps_low = 0.000001
+        eps_high = l_tilde - 0.000001
+        mu_b1, mu_b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+        n_b1, n_b2, n_d1, n_d2 = \
+            _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                 eps_high)
+        if return_paths:
+            if cvec is None:
+                cvec = np.zeros(p)
+                nvec = np.zeros(p)
+                bvec = np.zeros(p)
+            b_Sp1, solved = _cnb_core(
+                float(np.asarray(c_init).ravel()[0]),
+                np.ascontiguousarray(cum_growth, dtype=float),
+                np.ascontiguousarray(one_p_rnet, dtype=float),
+                np.ascontiguousarray(wnet, dtype=float),
+                np.ascontiguousarray(xpath, dtype=float),
+                float(b_init), sigma, l_tilde, b_ellip, upsilon,
+                np.ascontiguousarray(chi_n_vec, dtype=float), epsilon,
+                mu_b1, mu_b2, eps_low, eps_high, n_b1, n_b2, n_d1,
+                n_d2, cvec, nvec, bvec)
+            if solved:
+                return cvec, nvec, bvec, b_Sp1
+        else:
+            b_Sp1, solved = _cnb_last_core(
+                float(np.asarray(c_init).ravel()[0]),
+                np.ascontiguousarray(cum_growth, dtype=float),
+                np.ascontiguousarray(one_p_rnet, dtype=float),
+                np.ascontiguousarray(wnet, dtype=float),
+                np.ascontiguousarray(xpath, dtype=float),
+                float(b_init), sigma, l_tilde, b_ellip, upsilon,
+                np.ascontiguousarray(chi_n_vec, dtype=float), epsilon,
+                mu_b1, mu_b2, eps_low, eps_high, n_b1, n_b2, n_d1,
+                n_d2)
+            if solved:
+                return b_Sp1
+    if cvec is None:
+        cvec = np.zeros(p)
+        nvec = np.zeros(p)
+        bvec = np.zeros(p)
+    # The intertemporal Euler equation makes the consumption path the
+    # cumulative product of the growth factors scaled by c_init
+    cvec[:] = cum_growth
+    cvec *= c_init
+    # The labor supply FOCs are independent across ages once the
+    # consumption path is known, so all p of them are solved in one
+    # batched Newton iteration instead of p per-age root-finder calls
+    A = wnet * MU_c_stitch(cvec, sigma)
+    n_sol, n_conv = _batched_solve_n(A, chi_n_vec, l_tilde, b_ellip,
+                                     upsilon)
+    nvec[:] = n_sol
+    if not n_conv.all():
+        n_options = {'maxiter': 500}
+        for per in np.nonzero(~n_conv)[0]:
+            n_args = [wpath[per], cvec[per], sigma, l_tilde,
+                      chi_n_vec[per], b_ellip, upsilon, tau_l, diff]
+            result_n = \
+                opt.root(get_n_errors, l_tilde / 2, args=(n_args),
+                         method='lm', tol=1e-14, options=(n_options))
+
+            nvec[per] = result_n.x
+    # The flat tax rates fold into net-of-tax prices, so each budget
+    # update is one fused pass rather than separate tax subtractions
     for per in range(p):
         if per == 0:
             bvec[per] = b_init
-            cvec[per] = c_init
         else:
-            bvec[per] = ((1 + rpath[per - 1]) * bvec[per - 1] +
-                         wpath[per - 1] * nvec[per - 1] - cvec[per - 1]
-                         + xpath[per-1]
-                         - tau_k*rpath[per - 1]*bvec[per - 1]
-                         - tau_l*wpath[per-1]*nvec[per-1])
-            cvec[per] = cvec[per - 1] * ((beta * (1 + (1-tau_k)*rpath[per])) **
-                                         (1 / sigma))
-        n_options = {'maxiter': 500}
-        n_args = [wpath[per], cvec[per], sigma, l_tilde, chi_n_vec[per],
-                  b_ellip, upsilon, tau_l, diff]
-        result_n = \
-            opt.root(get_n_errors, l_tilde / 2, args=(n_args),
-                     method='lm', tol=1e-14, options=(n_options))
+            bvec[per] = (one_p_rnet[per - 1] * bvec[per - 1] +
+                         wnet[per - 1] * nvec[per - 1] -
+                         cvec[per - 1] + xpath[per - 1])
+
+    b_Sp1 = (one_p_rnet[-1] * bvec[-1] + wnet[-1] * nvec[-1] -
+             cvec[-1] + xpath[per-1])
 
-        nvec[per] = result_n.x
+    if return_paths:
+        return cvec, nvec, bvec, b_Sp1
 
+    return b_Sp1
 
-    b_Sp1 = ((1 + rpath[-1]) * bvec[-1] + wpath[-1] * nvec[-1] - cvec[-1]
-             + xpath[per-1] - tau_k*rpath[-1]*bvec[-1]
-             - tau_l*wpath[-1]*nvec[-1])
 
-    return cvec, nvec, bvec, b_Sp1
+# Cache of reusable (cvec, nvec, bvec) path buffers keyed on remaining
+# lifetime length, shared by all c1_bSp1err() calls of the same length
+_cnb_buffers = {}
 
 
 def c1_bSp1err(c_init, *args):
@@ -708,7 +1495,441 @@ def c1_bSp1err(c_init, *args):
         xpath, rpath, wpath, diff) = args
     cnb_args = (b_init, beta, sigma, l_tilde, b_ellip, upsilon,
                 chi_n_vec, tax_params, diff)
-    cvec, nvec, bvec, b_Sp1 = get_cnb_vecs(c_init, rpath, wpath, xpath,
-                                           cnb_args)
+    # Only the scalar b_Sp1 is consumed here, so the b_Sp1-only fast
+    # path skips the path arrays entirely. The reusable buffers are
+    # still passed for the NumPy fallback, which writes paths
+    p = rpath.shape[0]
+    bufs = _cnb_buffers.get(p)
+    if bufs is None:
+        bufs = (np.zeros(p), np.zeros(p), np.zeros(p))
+        _cnb_buffers[p] = bufs
+    b_Sp1 = get_cnb_vecs(c_init, rpath, wpath, xpath, cnb_args,
+                         out=bufs, return_paths=False)
 
     return b_Sp1
+
+
+def make_c1_bSp1err(args):
+    '''
+    --------------------------------------------------------------------
+    Build a closure with the same residual as c1_bSp1err() but with the
+    12-tuple of arguments unpacked once up front instead of on every
+    call. A root finder drives the residual dozens of times per
+    household, so closing over the pre-built get_cnb_vecs() arguments
+    and path buffers removes the per-iteration tuple destructuring and
+    reconstruction from the hot path
+    --------------------------------------------------------------------
+    INPUTS:
+    args = length 12 tuple, (b_init, beta, sigma, l_tilde, b_ellip,
+           upsilon, chi_n_vec, tax_params, xpath, rpath, wpath, diff),
+           same ordering as the args of c1_bSp1err()
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        build_get_cnb_vecs()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    cnb_vecs = function, calibration-specialized lifetime solver from
+               build_get_cnb_vecs()
+    p        = integer >= 1, number of periods remaining in life
+    bufs     = length 3 tuple, reusable (cvec, nvec, bvec) path buffers
+    c1_err   = function, residual b_Sp1 as a function of c_init only
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: c1_err
+    --------------------------------------------------------------------
+    '''
+    (b_init, beta, sigma, l_tilde, b_ellip, upsilon, chi_n_vec, tax_params,
+        xpath, rpath, wpath, diff) = args
+    cnb_vecs = build_get_cnb_vecs(beta, sigma, l_tilde, b_ellip,
+                                  upsilon, tax_params, diff)
+    p = rpath.shape[0]
+    bufs = _cnb_buffers.get(p)
+    if bufs is None:
+        bufs = (np.zeros(p), np.zeros(p), np.zeros(p))
+        _cnb_buffers[p] = bufs
+    # The Euler growth factors and net-of-tax prices are invariant to
+    # c_init, so they are hoisted out of the root-finder iterations
+    tau_l, tau_k, tau_c = tax_params
+    one_p_rnet = 1 + (1 - tau_k) * np.asarray(rpath, dtype=float)
+    wnet = (1 - tau_l) * np.asarray(wpath, dtype=float)
+    cum_growth = np.cumprod(
+        np.append(1.0, (beta * one_p_rnet[1:]) ** (1 / sigma)))
+    path_precomp = (cum_growth, one_p_rnet, wnet)
+    chi_n_arr = np.ascontiguousarray(chi_n_vec, dtype=float)
+    xpath_arr = np.ascontiguousarray(xpath, dtype=float)
+
+    def c1_err(c_init):
+        b_Sp1 = cnb_vecs(c_init, rpath, wpath, xpath_arr, b_init,
+                         chi_n_arr, out=bufs, precomp=path_precomp,
+                         return_paths=False)
+
+        return b_Sp1
+
+    return c1_err
+
+
+# Cache of calibration-specialized lifetime solvers keyed on the
+# calibration constants, so every solver of the same model run shares
+# one pair of specialized compiled kernels
+_get_cnb_vecs_cache = {}
+
+
+def build_get_cnb_vecs(beta, sigma, l_tilde, b_ellip, upsilon,
+                       tax_params, diff):
+    '''
+    --------------------------------------------------------------------
+    Build a lifetime solver with the same semantics as get_cnb_vecs()
+    but specialized on a fixed calibration. The preference parameters,
+    tax rates, and stitch coefficients are frozen into the closures of
+    thin jitted wrappers around _cnb_core() and _cnb_last_core(), so
+    numba compiles them as literal constants and the per-call scalar
+    marshalling, tuple unpacking, and memoized coefficient lookups of
+    get_cnb_vecs() drop out of the hot path. Only the quantities that
+    genuinely vary across solves remain arguments: the initial
+    consumption guess, the price and transfer paths, initial wealth,
+    and the remaining-lifetime chi^n_s slice. Solvers are cached per
+    calibration, mirroring make_bn_residual()
+    --------------------------------------------------------------------
+    INPUTS:
+    beta       = scalar in (0, 1), discount factor
+    sigma      = scalar >= 1, coefficient of relative risk aversion
+    l_tilde    = scalar > 0, per-period time endowment for every agent
+    b_ellip    = scalar > 0, fitted value of b for elliptical
+                 disutility of labor
+    upsilon    = scalar > 1, fitted value of upsilon for elliptical
+                 disutility of labor
+    tax_params = length 3 tuple, (tau_l, tau_k, tau_c)
+    diff       = boolean, =True if simple difference Euler error,
+                 otherwise percent deviation Euler error
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mu_c_stitch_coeffs()
+        _mdu_n_stitch_coeffs()
+        get_cnb_vecs()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    cnb_vecs = function, lifetime solver with signature (c_init, rpath,
+               wpath, xpath, b_init, chi_n_vec, out=None, precomp=None,
+               return_paths=True) and the same returns as
+               get_cnb_vecs()
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: cnb_vecs
+    --------------------------------------------------------------------
+    '''
+    tau_l, tau_k, tau_c = tax_params
+    key = (beta, sigma, l_tilde, b_ellip, upsilon, tau_l, tau_k, tau_c,
+           diff)
+    cached = _get_cnb_vecs_cache.get(key)
+    if cached is not None:
+        return cached
+    if njit is not None:
+        epsilon = 0.0001
+        eps_low = 0.000001
+        eps_high = l_tilde - 0.000001
+        mu_b1, mu_b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+        n_b1, n_b2, n_d1, n_d2 = \
+            _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                 eps_high)
+
+        # The calibration scalars are free variables of these wrappers,
+        # so numba freezes them as compile-time constants in the
+        # specialized kernels
+        @njit(fastmath=True, nogil=True)
+        def _spec_core(c1, cum_growth, one_p_rnet, wnet, xpath, b_init,
+                       chi_n_vec, cvec, nvec, bvec):
+            return _cnb_core(c1, cum_growth, one_p_rnet, wnet, xpath,
+                             b_init, sigma, l_tilde, b_ellip, upsilon,
+                             chi_n_vec, epsilon, mu_b1, mu_b2, eps_low,
+                             eps_high, n_b1, n_b2, n_d1, n_d2, cvec,
+                             nvec, bvec)
+
+        @njit(fastmath=True, nogil=True)
+        def _spec_last(c1, cum_growth, one_p_rnet, wnet, xpath, b_init,
+                       chi_n_vec):
+            return _cnb_last_core(c1, cum_growth, one_p_rnet, wnet,
+                                  xpath, b_init, sigma, l_tilde,
+                                  b_ellip, upsilon, chi_n_vec, epsilon,
+                                  mu_b1, mu_b2, eps_low, eps_high,
+                                  n_b1, n_b2, n_d1, n_d2)
+    else:
+        _spec_core = _spec_last = None
+
+    def cnb_vecs(c_init, rpath, wpath, xpath, b_init, chi_n_vec,
+                 out=None, precomp=None, return_paths=True):
+        p = rpath.shape[0]
+        if precomp is None:
+            one_p_rnet = 1 + (1 - tau_k) * np.asarray(rpath,
+                                                      dtype=float)
+            wnet = (1 - tau_l) * np.asarray(wpath, dtype=float)
+            cum_growth = np.cumprod(
+                np.append(1.0, (beta * one_p_rnet[1:]) ** (1 / sigma)))
+            precomp = (cum_growth, one_p_rnet, wnet)
+        else:
+            cum_growth, one_p_rnet, wnet = precomp
+        if _spec_core is not None:
+            c1 = float(np.asarray(c_init).ravel()[0])
+            cum_growth = np.ascontiguousarray(cum_growth, dtype=float)
+            one_p_rnet = np.ascontiguousarray(one_p_rnet, dtype=float)
+            wnet = np.ascontiguousarray(wnet, dtype=float)
+            xpath_c = np.ascontiguousarray(xpath, dtype=float)
+            chi_n_c = np.ascontiguousarray(chi_n_vec, dtype=float)
+            if return_paths:
+                if out is None:
+                    cvec = np.zeros(p)
+                    nvec = np.zeros(p)
+                    bvec = np.zeros(p)
+                else:
+                    cvec, nvec, bvec = out
+                b_Sp1, solved = _spec_core(c1, cum_growth, one_p_rnet,
+                                           wnet, xpath_c,
+                                           float(b_init), chi_n_c,
+                                           cvec, nvec, bvec)
+                if solved:
+                    return cvec, nvec, bvec, b_Sp1
+            else:
+                b_Sp1, solved = _spec_last(c1, cum_growth, one_p_rnet,
+                                           wnet, xpath_c,
+                                           float(b_init), chi_n_c)
+                if solved:
+                    return b_Sp1
+        # Fall back on the generic solver, which covers NumPy-only
+        # installs and the rare unconverged labor supply solves
+        params = (b_init, beta, sigma, l_tilde, b_ellip, upsilon,
+                  chi_n_vec, tax_params, diff)
+        return get_cnb_vecs(c_init, rpath, wpath, xpath, params,
+                            out=out, precomp=precomp,
+                            return_paths=return_paths)
+
+    _get_cnb_vecs_cache[key] = cnb_vecs
+
+    return cnb_vecs
+
+
+def _cnb_path_precomp(rpath_mat, wpath_mat, beta, sigma, tau_l, tau_k):
+    '''
+    --------------------------------------------------------------------
+    Precompute the arrays of the lifetime recursion that are invariant
+    to initial consumption: the cumulative products of the Euler growth
+    factors (beta * (1 + (1 - tau_k) * r)) ** (1 / sigma) with first
+    element 1 in each row, 1 + (1 - tau_k) * rpath_mat, and
+    (1 - tau_l) * wpath_mat. A root finder varying c1 computes these
+    once per solve instead of once per iteration
+    --------------------------------------------------------------------
+    INPUTS:
+    rpath_mat = (H, S) matrix, interest rate paths by household
+    wpath_mat = (H, S) matrix, wage paths by household
+    beta      = scalar in (0, 1), discount factor
+    sigma     = scalar >= 1, coefficient of relative risk aversion
+    tau_l     = scalar, labor income tax rate
+    tau_k     = scalar, capital income tax rate
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION: None
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    rnet_mat   = (H, S) matrix, 1 + (1 - tau_k) * rpath_mat
+    wnet_mat   = (H, S) matrix, (1 - tau_l) * wpath_mat
+    growth_mat = (H, S) matrix, cumulative Euler growth factors by
+                 household
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: growth_mat, rnet_mat, wnet_mat
+    --------------------------------------------------------------------
+    '''
+    rnet_mat = 1 + (1 - tau_k) * np.asarray(rpath_mat, dtype=float)
+    wnet_mat = (1 - tau_l) * np.asarray(wpath_mat, dtype=float)
+    growth_mat = np.empty_like(rnet_mat)
+    growth_mat[:, 0] = 1.0
+    growth_mat[:, 1:] = (beta * rnet_mat[:, 1:]) ** (1 / sigma)
+    np.cumprod(growth_mat, axis=1, out=growth_mat)
+
+    return growth_mat, rnet_mat, wnet_mat
+
+
+def get_cnb_vecs_batch(c1_vec, rpath_mat, wpath_mat, xpath_mat, chi_mat,
+                       b_init_vec, p_vec, params, precomp=None):
+    '''
+    --------------------------------------------------------------------
+    Solve the lifetime decisions of H independent households at once.
+    Each household h lives p_vec[h] more periods, stored in the first
+    p_vec[h] columns of row h of the (H, S) price, transfer, and chi_n
+    matrices, with the lifetime axis contiguous in memory. When numba
+    is available the batch runs through a compiled kernel parallelized
+    over households; otherwise, or for any household whose compiled
+    solve does not converge, the household falls back on get_cnb_vecs()
+    --------------------------------------------------------------------
+    INPUTS:
+    c1_vec     = (H,) vector, initial period consumption by household
+    rpath_mat  = (H, S) matrix, interest rate paths by household, row h
+                 padded with zeros beyond column p_vec[h]
+    wpath_mat  = (H, S) matrix, wage paths by household
+    xpath_mat  = (H, S) matrix, transfer paths by household
+    chi_mat    = (H, S) matrix, chi^n_s values by household
+    b_init_vec = (H,) vector, initial wealth by household
+    p_vec      = (H,) integer vector, remaining lifetime lengths
+    params     = length 7 tuple, (beta, sigma, l_tilde, b_ellip,
+                 upsilon, tax_params, diff)
+    precomp    = length 3 tuple or None, optional precomputed
+                 (growth_mat, rnet_mat, wnet_mat) matrices of
+                 cumulative Euler growth factors, 1 + (1 - tau_k) *
+                 rpath_mat, and (1 - tau_l) * wpath_mat. These are
+                 invariant to c1_vec, so a root finder varying c1_vec
+                 can hoist them out of its iterations
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        _mu_c_stitch_coeffs()
+        _mdu_n_stitch_coeffs()
+        _cnb_path_precomp()
+        get_cnb_vecs()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    cmat     = (H, S) matrix, consumption paths by household
+    nmat     = (H, S) matrix, labor supply paths by household
+    bmat     = (H, S) matrix, savings paths by household
+    bSp1_vec = (H,) vector, terminal savings by household
+    ok_vec   = (H,) Boolean vector, =True where the compiled solve
+               converged
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: cmat, nmat, bmat, bSp1_vec
+    --------------------------------------------------------------------
+    '''
+    beta, sigma, l_tilde, b_ellip, upsilon, tax_params, diff = params
+    tau_l, tau_k, tau_c = tax_params
+    H, S = rpath_mat.shape
+    if precomp is None:
+        precomp = _cnb_path_precomp(rpath_mat, wpath_mat, beta, sigma,
+                                    tau_l, tau_k)
+    growth_mat, rnet_mat, wnet_mat = precomp
+    cmat = np.zeros((H, S))
+    nmat = np.zeros((H, S))
+    bmat = np.zeros((H, S))
+    bSp1_vec = np.zeros(H)
+    if njit is not None:
+        epsilon = 0.0001
+        eps_low = 0.000001
+        eps_high = l_tilde - 0.000001
+        mu_b1, mu_b2 = _mu_c_stitch_coeffs(sigma, epsilon)
+        n_b1, n_b2, n_d1, n_d2 = \
+            _mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                 eps_high)
+        ok_vec = np.zeros(H, dtype=np.bool_)
+        _cnb_batch_core(
+            np.ascontiguousarray(c1_vec, dtype=float),
+            np.ascontiguousarray(growth_mat, dtype=float),
+            np.ascontiguousarray(rnet_mat, dtype=float),
+            np.ascontiguousarray(wnet_mat, dtype=float),
+            np.ascontiguousarray(xpath_mat, dtype=float),
+            np.ascontiguousarray(chi_mat, dtype=float),
+            np.ascontiguousarray(b_init_vec, dtype=float),
+            np.ascontiguousarray(p_vec, dtype=np.int64), sigma,
+            l_tilde, b_ellip, upsilon, epsilon, mu_b1, mu_b2, eps_low,
+            eps_high, n_b1, n_b2, n_d1, n_d2, cmat, nmat, bmat,
+            bSp1_vec, ok_vec)
+        redo = np.nonzero(~ok_vec)[0]
+    else:
+        redo = np.arange(H)
+    for h in redo:
+        p = p_vec[h]
+        cnb_args = (b_init_vec[h], beta, sigma, l_tilde, b_ellip,
+                    upsilon, chi_mat[h, :p], tax_params, diff)
+        cvec, nvec, bvec, b_Sp1 = \
+            get_cnb_vecs(c1_vec[h], rpath_mat[h, :p], wpath_mat[h, :p],
+                         xpath_mat[h, :p], cnb_args,
+                         precomp=(growth_mat[h, :p], rnet_mat[h, :p],
+                                  wnet_mat[h, :p]))
+        cmat[h, :p] = cvec
+        nmat[h, :p] = nvec
+        bmat[h, :p] = bvec
+        bSp1_vec[h] = b_Sp1
+
+    return cmat, nmat, bmat, bSp1_vec
+
+
+def solve_c1_batch(c1_init_vec, rpath_mat, wpath_mat, xpath_mat,
+                   chi_mat, b_init_vec, p_vec, params, tol,
+                   maxiter=50):
+    '''
+    --------------------------------------------------------------------
+    Solve for the initial period consumption of H independent
+    households at once by a vectorized quasi-Newton iteration on the
+    whole c1 vector. The terminal savings residual b_Sp1 of each
+    household is an independent monotone function of its own c1, so one
+    batched get_cnb_vecs_batch() evaluation per iteration updates every
+    household simultaneously, with the derivative taken by forward
+    difference. Households that do not reach |b_Sp1| < tol are flagged
+    so the caller can fall back on a scalar root finder
+    --------------------------------------------------------------------
+    INPUTS:
+    c1_init_vec = (H,) vector, initial guesses for c1 by household
+    rpath_mat   = (H, S) matrix, interest rate paths by household
+    wpath_mat   = (H, S) matrix, wage paths by household
+    xpath_mat   = (H, S) matrix, transfer paths by household
+    chi_mat     = (H, S) matrix, chi^n_s values by household
+    b_init_vec  = (H,) vector, initial wealth by household
+    p_vec       = (H,) integer vector, remaining lifetime lengths
+    params      = length 7 tuple, (beta, sigma, l_tilde, b_ellip,
+                  upsilon, tax_params, diff)
+    tol         = scalar > 0, convergence tolerance on |b_Sp1|
+    maxiter     = integer >= 1, maximum quasi-Newton iterations
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        get_cnb_vecs_batch()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    c1_vec    = (H,) vector, quasi-Newton iterate of c1 by household
+    bSp1_vec  = (H,) vector, terminal savings residuals
+    converged = (H,) Boolean vector, =True where |b_Sp1| < tol
+    step      = (H,) vector, forward-difference step sizes
+    deriv     = (H,) vector, d(b_Sp1)/d(c1) forward differences
+    cmat      = (H, S) matrix, consumption paths at the solution
+    nmat      = (H, S) matrix, labor supply paths at the solution
+    bmat      = (H, S) matrix, savings paths at the solution
+
+    FILES CREATED BY THIS FUNCTION: None
+
+    RETURNS: c1_vec, cmat, nmat, bmat, bSp1_vec, converged
+    --------------------------------------------------------------------
+    '''
+    c1_vec = np.array(c1_init_vec, dtype=float)
+    H = c1_vec.shape[0]
+    converged = np.zeros(H, dtype=bool)
+    # The growth factors and net prices are invariant to c1, so they
+    # are computed once here rather than inside every batched residual
+    # evaluation below
+    beta, sigma = params[0], params[1]
+    tau_l, tau_k = params[5][0], params[5][1]
+    precomp = _cnb_path_precomp(rpath_mat, wpath_mat, beta, sigma,
+                                tau_l, tau_k)
+    for it in range(maxiter):
+        cmat, nmat, bmat, bSp1_vec = \
+            get_cnb_vecs_batch(c1_vec, rpath_mat, wpath_mat, xpath_mat,
+                               chi_mat, b_init_vec, p_vec, params,
+                               precomp=precomp)
+        converged = np.abs(bSp1_vec) < tol
+        if converged.all():
+            break
+        step = 1e-7 * np.maximum(1.0, np.abs(c1_vec))
+        cmat_h, nmat_h, bmat_h, bSp1_h = \
+            get_cnb_vecs_batch(c1_vec + step, rpath_mat, wpath_mat,
+                               xpath_mat, chi_mat, b_init_vec, p_vec,
+                               params, precomp=precomp)
+        deriv = (bSp1_h - bSp1_vec) / step
+        # Terminal savings fall in c1, so a vanishing forward
+        # difference means the step is numerically flat; freeze those
+        # households rather than divide by zero
+        safe = np.abs(deriv) > 1e-300
+        c1_vec = np.where(converged | ~safe, c1_vec,
+                          c1_vec - bSp1_vec / np.where(safe, deriv, 1.0))
+    else:
+        cmat, nmat, bmat, bSp1_vec = \
+            get_cnb_vecs_batch(c1_vec, rpath_mat, wpath_mat, xpath_mat,
+                               chi_mat, b_init_vec, p_vec, params,
+                               precomp=precomp)
+        converged = np.abs(bSp1_vec) < tol
+
+    return c1_vec, cmat, nmat, bmat, bSp1_vec, converged
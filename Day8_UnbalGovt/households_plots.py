@@ -0,0 +1,196 @@
+'''
+------------------------------------------------------------------------
+This module contains the diagnostic plotting functions for the stitched
+marginal utility functions in households.py. Keeping the plotting code
+and its matplotlib and filesystem dependencies here, rather than inside
+the numerical functions, keeps the model solution path free of
+diagnostic-only work.
+
+This Python module imports the following module(s):
+    households.py
+
+This Python module defines the following function(s):
+    plot_MU_c_stitch()
+    plot_MDU_n_stitch()
+------------------------------------------------------------------------
+'''
+# Import packages
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.ticker import MultipleLocator
+import os
+import households as hh
+
+'''
+------------------------------------------------------------------------
+    Functions
+------------------------------------------------------------------------
+'''
+
+
+def plot_MU_c_stitch(sigma):
+    '''
+    --------------------------------------------------------------------
+    Plot the CRRA marginal utility of consumption and the linear
+    function stitched onto it below epsilon in hh.MU_c_stitch()
+    --------------------------------------------------------------------
+    INPUTS:
+    sigma = scalar >= 1, coefficient of relative risk aversion for CRRA
+            utility function: (c**(1-sigma) - 1) / (1 - sigma)
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        hh._mu_c_stitch_coeffs()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    epsilon     = scalar > 0, positive value close to zero
+    b1          = scalar, intercept value in linear marginal utility
+    b2          = scalar, slope coefficient in linear marginal utility
+    cur_path    = string, path name of current directory
+    output_fldr = string, folder in current path to save files
+    output_dir  = string, total path of images folder
+    output_path = string, path of file name of figure to be saved
+    cvec_CRRA   = (1000,) vector, support of c including values
+                  between 0 and epsilon
+    MU_CRRA     = (1000,) vector, CRRA marginal utility of consumption
+    cvec_stitch = (500,) vector, stitched support of consumption
+                  including negative values up to epsilon
+    MU_stitch   = (500,) vector, stitched marginal utility of
+                  consumption
+
+    FILES CREATED BY THIS FUNCTION:
+        MU_c_stitched.png
+
+    RETURNS: None
+    --------------------------------------------------------------------
+    '''
+    epsilon = 0.0001
+    b1, b2 = hh._mu_c_stitch_coeffs(sigma, epsilon)
+
+    # Create directory if images directory does not already exist
+    cur_path = os.path.split(os.path.abspath(__file__))[0]
+    output_fldr = "images"
+    output_dir = os.path.join(cur_path, output_fldr)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Plot CRRA and stitched marginal utility of consumption
+    cvec_CRRA = np.linspace(epsilon / 2, epsilon * 3, 1000)
+    MU_CRRA = cvec_CRRA ** (-sigma)
+    cvec_stitch = np.linspace(-0.00005, epsilon, 500)
+    MU_stitch = 2 * b2 * cvec_stitch + b1
+    fig, ax = plt.subplots()
+    plt.plot(cvec_CRRA, MU_CRRA, ls='solid', label='$u\'(c)$: CRRA')
+    plt.plot(cvec_stitch, MU_stitch, ls='dashed', color='red',
+             label='$g\'(c)$: stitched')
+    # for the minor ticks, use no labels; default NullFormatter
+    minorLocator = MultipleLocator(1)
+    ax.xaxis.set_minor_locator(minorLocator)
+    plt.grid(visible=True, which='major', color='0.65', linestyle='-')
+    plt.title('Marginal utility of consumption with stitched ' +
+              'function', fontsize=14)
+    plt.xlabel(r'Consumption $c$')
+    plt.ylabel(r'Marginal utility $u\'(c)$')
+    plt.xlim((-0.00005, epsilon * 3))
+    plt.legend(loc='upper right')
+    output_path = os.path.join(output_dir, "MU_c_stitched")
+    plt.savefig(output_path)
+    # plt.show()
+
+
+def plot_MDU_n_stitch(params):
+    '''
+    --------------------------------------------------------------------
+    Plot the elliptical marginal disutility of labor and the linear
+    functions stitched onto it outside [eps_low, eps_high] in
+    hh.MDU_n_stitch()
+    --------------------------------------------------------------------
+    INPUTS:
+    params = length 3 tuple, (l_tilde, b_ellip, upsilon)
+
+    OTHER FUNCTIONS AND FILES CALLED BY THIS FUNCTION:
+        hh._mdu_n_stitch_coeffs()
+
+    OBJECTS CREATED WITHIN FUNCTION:
+    l_tilde         = scalar > 0, time endowment for each agent each per
+    b_ellip         = scalar > 0, scale parameter for elliptical utility
+                      of leisure function
+    upsilon         = scalar > 1, shape parameter for elliptical utility
+                      of leisure function
+    eps_low         = scalar > 0, positive value close to zero
+    eps_high        = scalar > 0, positive value just less than l_tilde
+    b1              = scalar, intercept value in linear marginal
+                      disutility of labor at lower bound
+    b2              = scalar, slope coefficient in linear marginal
+                      disutility of labor at lower bound
+    d1              = scalar, intercept value in linear marginal
+                      disutility of labor at upper bound
+    d2              = scalar, slope coefficient in linear marginal
+                      disutility of labor at upper bound
+    cur_path        = string, path name of current directory
+    output_fldr     = string, folder in current path to save files
+    output_dir      = string, total path of images folder
+    output_path     = string, path of file name of figure to be saved
+    nvec_ellip      = (1000,) vector, support of n including values
+                      between 0 and eps_low and between eps_high and
+                      l_tilde
+    MDU_ellip       = (1000,) vector, elliptical marginal disutility of
+                      labor
+    n_stitch_low    = (500,) vector, stitched support of labor supply
+                      below eps_low
+    MDU_stitch_low  = (500,) vector, stitched marginal disutility of
+                      labor below eps_low
+    n_stitch_high   = (500,) vector, stitched support of labor supply
+                      above eps_high
+    MDU_stitch_high = (500,) vector, stitched marginal disutility of
+                      labor above eps_high
+
+    FILES CREATED BY THIS FUNCTION:
+        MDU_n_stitched.png
+
+    RETURNS: None
+    --------------------------------------------------------------------
+    '''
+    l_tilde, b_ellip, upsilon = params
+    eps_low = 0.000001
+    eps_high = l_tilde - 0.000001
+    b1, b2, d1, d2 = \
+        hh._mdu_n_stitch_coeffs(l_tilde, b_ellip, upsilon, eps_low,
+                                eps_high)
+
+    # Create directory if images directory does not already exist
+    cur_path = os.path.split(os.path.abspath(__file__))[0]
+    output_fldr = "images"
+    output_dir = os.path.join(cur_path, output_fldr)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Plot elliptical and stitched marginal disutility of labor
+    nvec_ellip = np.linspace(eps_low / 2, eps_high +
+                             ((l_tilde - eps_high) / 5), 1000)
+    MDU_ellip = (
+        (b_ellip / l_tilde) *
+        ((nvec_ellip / l_tilde) ** (upsilon - 1)) *
+        ((1 - ((nvec_ellip / l_tilde) ** upsilon)) **
+         ((1 - upsilon) / upsilon)))
+    n_stitch_low = np.linspace(-0.05, eps_low, 500)
+    MDU_stitch_low = 2 * b2 * n_stitch_low + b1
+    n_stitch_high = np.linspace(eps_high, l_tilde + 0.000005, 500)
+    MDU_stitch_high = 2 * d2 * n_stitch_high + d1
+    fig, ax = plt.subplots()
+    plt.plot(nvec_ellip, MDU_ellip, ls='solid', color='black',
+             label='$v\'(n)$: Elliptical')
+    plt.plot(n_stitch_low, MDU_stitch_low, ls='dashed', color='red',
+             label='$g\'(n)$: low stitched')
+    plt.plot(n_stitch_high, MDU_stitch_high, ls='dotted',
+             color='blue', label='$g\'(n)$: high stitched')
+    # for the minor ticks, use no labels; default NullFormatter
+    minorLocator = MultipleLocator(1)
+    ax.xaxis.set_minor_locator(minorLocator)
+    plt.grid(visible=True, which='major', color='0.65', linestyle='-')
+    plt.title('Marginal disutility of labor with stitched ' +
+              'function', fontsize=14)
+    plt.xlabel(r'Labor $n$')
+    plt.ylabel(r'Marginal disutility $v\'(n)$')
+    plt.xlim((-0.05, l_tilde + 0.01))
+    plt.legend(loc='upper left')
+    output_path = os.path.join(output_dir, "MDU_n_stitched")
+    plt.savefig(output_path)
+    # plt.show()